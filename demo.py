@@ -23,229 +23,340 @@ CATEGORY_ICONS = {
     "Archives": "📦", "Code": "💻", "Installers": "⚙️", "Other": "📁",
 }
 
-# ── App ──────────────────────────────────────────────────────────────
-root = ctk.CTk()
-root.title("SessionClean")
-root.geometry("950x580")
-root.minsize(800, 450)
-ctk.set_appearance_mode("dark")
-
-check_vars: dict[str, ctk.BooleanVar] = {}
-selected_file: dict | None = None
-
-# ── Header ───────────────────────────────────────────────────────────
-header = ctk.CTkFrame(root, fg_color="transparent")
-header.pack(fill="x", padx=20, pady=(15, 5))
-
-ctk.CTkLabel(
-    header, text="🧹 What did you download today?",
-    font=ctk.CTkFont(size=18, weight="bold"),
-).pack(side="left")
-
-total_size = sum(f["size"] for f in FAKE_FILES)
-ctk.CTkLabel(
-    header,
-    text=f"{len(FAKE_FILES)} files · {format_size(total_size)}",
-    font=ctk.CTkFont(size=13), text_color="#aaaaaa",
-).pack(side="right")
-
-# Instructions
-ctk.CTkLabel(
-    root,
-    text="Checked = KEEP.  Uncheck what you want to delete.",
-    font=ctk.CTkFont(size=12), text_color="#777777",
-).pack(padx=20, anchor="w")
-
-# ── Quick actions ────────────────────────────────────────────────────
-actions = ctk.CTkFrame(root, fg_color="transparent")
-actions.pack(fill="x", padx=20, pady=(8, 4))
-
-
-def select_all():
-    for v in check_vars.values():
-        v.set(True)
-
-
-def deselect_all():
-    for v in check_vars.values():
-        v.set(False)
-
-
-ctk.CTkButton(
-    actions, text="Keep All", width=80, height=28,
-    font=ctk.CTkFont(size=11), fg_color="#2ecc71", hover_color="#254d38",
-    command=select_all,
-).pack(side="left", padx=(0, 6))
-
-ctk.CTkButton(
-    actions, text="Delete All", width=80, height=28,
-    font=ctk.CTkFont(size=11), fg_color="#555555", hover_color="#383838",
-    command=deselect_all,
-).pack(side="left")
-
-summary_label = ctk.CTkLabel(
-    actions, text="", font=ctk.CTkFont(size=12, weight="bold"),
-    text_color="#e74c3c",
-)
-summary_label.pack(side="right")
-
-# ── Main content: file list (left) + preview (right) ────────────────
-content = ctk.CTkFrame(root, fg_color="transparent")
-content.pack(fill="both", expand=True, padx=20, pady=8)
-content.grid_columnconfigure(0, weight=3)
-content.grid_columnconfigure(1, weight=2)
-
-# ── Left: file list ─────────────────────────────────────────────────
-scroll = ctk.CTkScrollableFrame(content, fg_color="#2b2b2b", corner_radius=10)
-scroll.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
-
-# ── Right: preview panel ────────────────────────────────────────────
-preview = ctk.CTkFrame(content, fg_color="#2b2b2b", corner_radius=10)
-preview.grid(row=0, column=1, sticky="nsew")
-
-preview_title = ctk.CTkLabel(
-    preview, text="File Preview",
-    font=ctk.CTkFont(size=14, weight="bold"), text_color="#aaaaaa",
-)
-preview_title.pack(pady=(15, 10))
-
-preview_icon = ctk.CTkLabel(
-    preview, text="📁", font=ctk.CTkFont(size=48),
-)
-preview_icon.pack(pady=(10, 5))
-
-preview_name = ctk.CTkLabel(
-    preview, text="Select a file to preview",
-    font=ctk.CTkFont(size=14, weight="bold"), text_color="#ffffff",
-    wraplength=250,
-)
-preview_name.pack(pady=(5, 10))
-
-# Preview detail labels
-preview_details_frame = ctk.CTkFrame(preview, fg_color="transparent")
-preview_details_frame.pack(fill="x", padx=20, pady=5)
-
-detail_labels: dict[str, ctk.CTkLabel] = {}
-for key, label_text in [
-    ("size", "Size"),
-    ("type", "Type"),
-    ("location", "Location"),
-    ("created", "Created"),
-    ("status", "Status"),
-]:
-    row = ctk.CTkFrame(preview_details_frame, fg_color="transparent")
-    row.pack(fill="x", pady=2)
+# Row height for the virtualized file list
+ROW_H = 36
+
+
+def main():
+    # Precompute category, formatted size, and formatted timestamps once per
+    # file — the row builder and the preview panel both need them, and strftime
+    # in particular is expensive enough to matter on every click/redraw.
+    for f in FAKE_FILES:
+        f["_cat"] = get_file_category(f["path"])
+        f["_size_str"] = format_size(f["size"])
+        dt = datetime.fromtimestamp(f["created_at"])
+        f["_time_str"] = dt.strftime("%I:%M %p")
+        f["_created_str"] = dt.strftime("%Y-%m-%d  %I:%M %p")
+
+    # ── App ──────────────────────────────────────────────────────────
+    root = ctk.CTk()
+    root.title("SessionClean")
+    root.geometry("950x580")
+    root.minsize(800, 450)
+    ctk.set_appearance_mode("dark")
+
+    check_vars: dict[str, ctk.BooleanVar] = {}
+    selected_file: dict | None = None
+
+    # ── Header ───────────────────────────────────────────────────────
+    header = ctk.CTkFrame(root, fg_color="transparent")
+    header.pack(fill="x", padx=20, pady=(15, 5))
+
     ctk.CTkLabel(
-        row, text=f"{label_text}:", width=70, anchor="w",
-        font=ctk.CTkFont(size=12), text_color="#777777",
+        header, text="🧹 What did you download today?",
+        font=ctk.CTkFont(size=18, weight="bold"),
     ).pack(side="left")
-    val = ctk.CTkLabel(
-        row, text="—", anchor="w",
-        font=ctk.CTkFont(size=12), text_color="#cccccc",
-        wraplength=200,
-    )
-    val.pack(side="left", fill="x", expand=True)
-    detail_labels[key] = val
 
+    total_size = sum(f["size"] for f in FAKE_FILES)
+    ctk.CTkLabel(
+        header,
+        text=f"{len(FAKE_FILES)} files · {format_size(total_size)}",
+        font=ctk.CTkFont(size=13), text_color="#aaaaaa",
+    ).pack(side="right")
 
-def show_preview(file_info: dict):
-    category = get_file_category(file_info["path"])
-    icon = CATEGORY_ICONS.get(category, "📁")
-    preview_icon.configure(text=icon)
-    preview_name.configure(text=file_info["name"])
+    # Instructions
+    ctk.CTkLabel(
+        root,
+        text="Checked = KEEP.  Uncheck what you want to delete.",
+        font=ctk.CTkFont(size=12), text_color="#777777",
+    ).pack(padx=20, anchor="w")
+
+    # ── Quick actions ────────────────────────────────────────────────
+    actions = ctk.CTkFrame(root, fg_color="transparent")
+    actions.pack(fill="x", padx=20, pady=(8, 4))
+
+    def select_all():
+        nonlocal _bulk_update
+        _bulk_update = True
+        try:
+            for v in check_vars.values():
+                v.set(True)
+        finally:
+            _bulk_update = False
+        refresh_summary()
+
+    def deselect_all():
+        nonlocal _bulk_update
+        _bulk_update = True
+        try:
+            for v in check_vars.values():
+                v.set(False)
+        finally:
+            _bulk_update = False
+        refresh_summary()
+
+    ctk.CTkButton(
+        actions, text="Keep All", width=80, height=28,
+        font=ctk.CTkFont(size=11), fg_color="#2ecc71", hover_color="#254d38",
+        command=select_all,
+    ).pack(side="left", padx=(0, 6))
+
+    ctk.CTkButton(
+        actions, text="Delete All", width=80, height=28,
+        font=ctk.CTkFont(size=11), fg_color="#555555", hover_color="#383838",
+        command=deselect_all,
+    ).pack(side="left")
 
-    detail_labels["size"].configure(text=format_size(file_info["size"]))
-    detail_labels["type"].configure(
-        text=f"{category} (.{file_info.get('file_type', '?')})"
+    summary_label = ctk.CTkLabel(
+        actions, text="", font=ctk.CTkFont(size=12, weight="bold"),
+        text_color="#e74c3c",
     )
-    detail_labels["location"].configure(text=file_info.get("directory", ""))
+    summary_label.pack(side="right")
 
-    created_dt = datetime.fromtimestamp(file_info["created_at"])
-    detail_labels["created"].configure(
-        text=created_dt.strftime("%Y-%m-%d  %I:%M %p")
-    )
+    # ── Main content: file list (left) + preview (right) ─────────────
+    content = ctk.CTkFrame(root, fg_color="transparent")
+    content.pack(fill="both", expand=True, padx=20, pady=8)
+    content.grid_columnconfigure(0, weight=3)
+    content.grid_columnconfigure(1, weight=2)
+
+    # ── Left: file list ──────────────────────────────────────────────
+    scroll = ctk.CTkScrollableFrame(content, fg_color="#2b2b2b", corner_radius=10)
+    scroll.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
+
+    # ── Right: preview panel ─────────────────────────────────────────
+    preview = ctk.CTkFrame(content, fg_color="#2b2b2b", corner_radius=10)
+    preview.grid(row=0, column=1, sticky="nsew")
 
-    is_kept = check_vars.get(file_info["path"], ctk.BooleanVar(value=False)).get()
-    if is_kept:
-        detail_labels["status"].configure(text="✅ Keeping", text_color="#2ecc71")
-    else:
-        detail_labels["status"].configure(text="🗑️ Will be deleted", text_color="#e74c3c")
+    ctk.CTkLabel(
+        preview, text="File Preview",
+        font=ctk.CTkFont(size=14, weight="bold"), text_color="#aaaaaa",
+    ).pack(pady=(15, 10))
 
+    preview_icon = ctk.CTkLabel(
+        preview, text="📁", font=ctk.CTkFont(size=48),
+    )
+    preview_icon.pack(pady=(10, 5))
 
-def update_summary(*_):
-    keeping = sum(1 for v in check_vars.values() if v.get())
-    deleting = len(FAKE_FILES) - keeping
-    del_size = sum(
-        f["size"] for f in FAKE_FILES
-        if not check_vars.get(f["path"], ctk.BooleanVar(value=True)).get()
+    preview_name = ctk.CTkLabel(
+        preview, text="Select a file to preview",
+        font=ctk.CTkFont(size=14, weight="bold"), text_color="#ffffff",
+        wraplength=250,
     )
-    if deleting == 0:
-        summary_label.configure(
-            text=f"✅ Keeping all {keeping} files",
-            text_color="#2ecc71",
+    preview_name.pack(pady=(5, 10))
+
+    # Preview detail labels
+    preview_details_frame = ctk.CTkFrame(preview, fg_color="transparent")
+    preview_details_frame.pack(fill="x", padx=20, pady=5)
+
+    detail_labels: dict[str, ctk.CTkLabel] = {}
+    for key, label_text in [
+        ("size", "Size"),
+        ("type", "Type"),
+        ("location", "Location"),
+        ("created", "Created"),
+        ("status", "Status"),
+    ]:
+        row = ctk.CTkFrame(preview_details_frame, fg_color="transparent")
+        row.pack(fill="x", pady=2)
+        ctk.CTkLabel(
+            row, text=f"{label_text}:", width=70, anchor="w",
+            font=ctk.CTkFont(size=12), text_color="#777777",
+        ).pack(side="left")
+        val = ctk.CTkLabel(
+            row, text="—", anchor="w",
+            font=ctk.CTkFont(size=12), text_color="#cccccc",
+            wraplength=200,
         )
-    else:
-        summary_label.configure(
-            text=f"🗑️ {deleting} to delete · {format_size(del_size)}",
-            text_color="#e74c3c",
+        val.pack(side="left", fill="x", expand=True)
+        detail_labels[key] = val
+
+    # Direct references for the hot click path — show_preview runs on every
+    # row click and summary refresh, so skip the dict hashing on each call.
+    size_lbl = detail_labels["size"]
+    type_lbl = detail_labels["type"]
+    location_lbl = detail_labels["location"]
+    created_lbl = detail_labels["created"]
+    status_lbl = detail_labels["status"]
+    _icon_for = CATEGORY_ICONS.get
+
+    def _set_text(label, text):
+        # Each configure(text=...) redraws the label's canvas even when the
+        # text is unchanged; summary refreshes re-show the same file, so
+        # suppress the no-op calls.
+        if getattr(label, "_last_text", None) != text:
+            label._last_text = text
+            label.configure(text=text)
+
+    def show_preview(file_info: dict):
+        category = file_info["_cat"]
+        _set_text(preview_icon, _icon_for(category, "📁"))
+        _set_text(preview_name, file_info["name"])
+
+        _set_text(size_lbl, file_info["_size_str"])
+        _set_text(type_lbl, f"{category} (.{file_info.get('file_type', '?')})")
+        _set_text(location_lbl, file_info.get("directory", ""))
+
+        _set_text(created_lbl, file_info["_created_str"])
+
+        # Every file has an entry in check_vars — don't build a throw-away
+        # Tcl variable as a .get() default on each call.
+        is_kept = check_vars[file_info["path"]].get()
+        status = ("✅ Keeping", "#2ecc71") if is_kept else ("🗑️ Will be deleted", "#e74c3c")
+        if getattr(status_lbl, "_last_status", None) != status:
+            status_lbl._last_status = status
+            status_lbl.configure(text=status[0], text_color=status[1])
+
+    # Running counters — updated by per-checkbox delta callbacks so the
+    # summary never has to rescan all files (select_all used to trigger N
+    # full scans).
+    _kept_count = len(FAKE_FILES)
+    _deleting_bytes = 0
+    _bulk_update = False
+    _last_vals: dict[str, bool] = {}
+
+    def make_trace_cb(path: str, size: int):
+        """Build an O(1) trace callback that applies the toggle delta."""
+        def cb(*_):
+            nonlocal _kept_count, _deleting_bytes
+            new_val = check_vars[path].get()
+            if _last_vals[path] == new_val:
+                return
+            _last_vals[path] = new_val
+            if new_val:
+                _kept_count += 1
+                _deleting_bytes -= size
+            else:
+                _kept_count -= 1
+                _deleting_bytes += size
+            if not _bulk_update:
+                refresh_summary()
+        return cb
+
+    def refresh_summary():
+        deleting = len(FAKE_FILES) - _kept_count
+        if deleting == 0:
+            summary_label.configure(
+                text=f"✅ Keeping all {_kept_count} files",
+                text_color="#2ecc71",
+            )
+        else:
+            summary_label.configure(
+                text=f"🗑️ {deleting} to delete · {format_size(_deleting_bytes)}",
+                text_color="#e74c3c",
+            )
+        # Update preview status if a file is selected
+        if selected_file:
+            show_preview(selected_file)
+
+    # ── Render file rows (virtualized) ───────────────────────────────
+    # Only widgets for the visible viewport slice are materialized; a spacer
+    # frame reserves the full scroll height and a small pool of rows is
+    # repositioned/reconfigured as the viewport moves. Widget count stays
+    # bounded by viewport height instead of growing with the file count.
+
+    # Check vars stay fully populated — they're cheap; only widgets recycle.
+    for file_info in FAKE_FILES:
+        path = file_info["path"]
+        var = ctk.BooleanVar(value=True)  # Checked = keep by default
+        check_vars[path] = var
+        _last_vals[path] = True
+        var.trace_add("write", make_trace_cb(path, file_info["size"]))
+
+    # Spacer reserves the scrollable height for all rows.
+    spacer = ctk.CTkFrame(scroll, fg_color="transparent", height=len(FAKE_FILES) * ROW_H)
+    spacer.pack(fill="x")
+
+    _row_pool: list[dict] = []  # each: {"frame", "cb", "size_lbl", "time_lbl", "index"}
+
+    def _make_pool_row() -> dict:
+        frame = ctk.CTkFrame(scroll, fg_color="transparent", height=ROW_H)
+        cb = ctk.CTkCheckBox(frame, text="", font=ctk.CTkFont(size=13))
+        cb.pack(side="left", padx=(8, 4), pady=4)
+        size_label = ctk.CTkLabel(
+            frame, text="", font=ctk.CTkFont(size=11), text_color="#777777",
         )
-    # Update preview status if a file is selected
-    if selected_file:
-        show_preview(selected_file)
-
-
-# ── Render file rows ─────────────────────────────────────────────────
-for file_info in FAKE_FILES:
-    path = file_info["path"]
-    var = ctk.BooleanVar(value=True)  # Checked = keep by default
-    var.trace_add("write", update_summary)
-    check_vars[path] = var
-
-    row = ctk.CTkFrame(scroll, fg_color="transparent")
-    row.pack(fill="x", pady=1)
+        size_label.pack(side="right", padx=(0, 10))
+        time_label = ctk.CTkLabel(
+            frame, text="", font=ctk.CTkFont(size=11), text_color="#555555",
+        )
+        time_label.pack(side="right", padx=(0, 8))
+
+        entry = {"frame": frame, "cb": cb, "size_lbl": size_label,
+                 "time_lbl": time_label, "index": -1}
+        frame._row_index = -1  # read by the delegated click handler
+        return entry
+
+    def _assign_row(entry: dict, index: int) -> None:
+        """Point a pooled row widget at the file at FAKE_FILES[index]."""
+        entry["index"] = index
+        entry["frame"]._row_index = index
+        fi = FAKE_FILES[index]
+        icon = CATEGORY_ICONS.get(fi["_cat"], "📁")
+        entry["cb"].configure(text=f"{icon}  {fi['name']}", variable=check_vars[fi["path"]])
+        entry["size_lbl"].configure(text=fi["_size_str"])
+        entry["time_lbl"].configure(text=fi["_time_str"])
+        entry["frame"].place(x=0, y=index * ROW_H, relwidth=1.0, height=ROW_H)
+
+    def _update_viewport(event=None):
+        """Materialize row widgets only for the currently visible index range."""
+        canvas = scroll._parent_canvas
+        top = canvas.canvasy(0)
+        height = canvas.winfo_height()
+        first = max(0, int(top // ROW_H))
+        last = min(len(FAKE_FILES), first + height // ROW_H + 2)
+
+        needed = last - first
+        while len(_row_pool) < needed:
+            _row_pool.append(_make_pool_row())
+
+        for i, entry in enumerate(_row_pool):
+            index = first + i
+            if index < last:
+                _assign_row(entry, index)
+            else:
+                entry["index"] = -1
+                entry["frame"].place_forget()
+
+    def _on_row_click(event):
+        """Delegated click handler: walk up from the clicked widget to its row.
+
+        One binding total instead of one per row widget and child.
+        """
+        nonlocal selected_file
+        w = event.widget
+        while w is not None and getattr(w, "_row_index", None) is None:
+            w = getattr(w, "master", None)
+        if w is None:
+            return
+        index = w._row_index
+        if 0 <= index < len(FAKE_FILES):
+            selected_file = FAKE_FILES[index]
+            show_preview(selected_file)
+
+    def _on_scroll(*_):
+        scroll._parent_canvas.after_idle(_update_viewport)
+
+    root.bind_all("<Button-1>", _on_row_click, add="+")
+    scroll._parent_canvas.bind("<Configure>", _update_viewport, add="+")
+    for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        scroll._parent_canvas.bind_all(seq, _on_scroll, add="+")
+    scroll._scrollbar.configure(
+        command=lambda *args: (scroll._parent_canvas.yview(*args), _update_viewport())
+    )
 
-    category = get_file_category(path)
-    icon = CATEGORY_ICONS.get(category, "📁")
+    root.after_idle(_update_viewport)
 
-    cb = ctk.CTkCheckBox(
-        row, text=f"{icon}  {file_info['name']}",
-        variable=var, font=ctk.CTkFont(size=13),
-    )
-    cb.pack(side="left", padx=(8, 4), pady=4)
+    # ── Confirm button ───────────────────────────────────────────────
+    ctk.CTkButton(
+        root, text="✅ Confirm & Clean",
+        font=ctk.CTkFont(size=14, weight="bold"), height=45,
+        fg_color="#2ecc71", hover_color="#254d38",
+        command=lambda: root.quit(),
+    ).pack(fill="x", padx=20, pady=(4, 15))
 
-    # Created time
-    created_dt = datetime.fromtimestamp(file_info["created_at"])
-    time_str = created_dt.strftime("%I:%M %p")
+    refresh_summary()
+    root.mainloop()
 
-    ctk.CTkLabel(
-        row, text=format_size(file_info["size"]),
-        font=ctk.CTkFont(size=11), text_color="#777777",
-    ).pack(side="right", padx=(0, 10))
 
-    ctk.CTkLabel(
-        row, text=time_str,
-        font=ctk.CTkFont(size=11), text_color="#555555",
-    ).pack(side="right", padx=(0, 8))
-
-    # Click row to show preview
-    def make_click_handler(fi=file_info):
-        def handler(event):
-            nonlocal selected_file
-            selected_file = fi
-            show_preview(fi)
-        return handler
-
-    row.bind("<Button-1>", make_click_handler())
-    for child in row.winfo_children():
-        child.bind("<Button-1>", make_click_handler(), add="+")
-
-# ── Confirm button ───────────────────────────────────────────────────
-ctk.CTkButton(
-    root, text="✅ Confirm & Clean",
-    font=ctk.CTkFont(size=14, weight="bold"), height=45,
-    fg_color="#2ecc71", hover_color="#254d38",
-    command=lambda: root.quit(),
-).pack(fill="x", padx=20, pady=(4, 15))
-
-update_summary()
-root.mainloop()
+if __name__ == "__main__":
+    main()
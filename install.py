@@ -14,19 +14,16 @@ def get_python_path() -> str:
     return sys.executable
 
 
-def create_shortcut(
+def _shortcut_block(
     shortcut_path: str,
     target: str,
     arguments: str,
     working_dir: str,
     description: str,
     icon_path: str | None = None,
-) -> None:
-    """Create a Windows shortcut (.lnk) file."""
-    import subprocess
-    # Use PowerShell to create the shortcut
-    ps_script = f"""
-$WshShell = New-Object -ComObject WScript.Shell
+) -> str:
+    """Build the PowerShell block for a single shortcut (no shell setup)."""
+    block = f"""
 $Shortcut = $WshShell.CreateShortcut("{shortcut_path}")
 $Shortcut.TargetPath = "{target}"
 $Shortcut.Arguments = "{arguments}"
@@ -34,8 +31,48 @@ $Shortcut.WorkingDirectory = "{working_dir}"
 $Shortcut.Description = "{description}"
 """
     if icon_path:
-        ps_script += f'$Shortcut.IconLocation = "{icon_path}"\n'
-    ps_script += "$Shortcut.Save()\n"
+        block += f'$Shortcut.IconLocation = "{icon_path}"\n'
+    block += "$Shortcut.Save()\n"
+    return block
+
+
+def create_shortcuts(specs: list[dict]) -> None:
+    """Create several Windows shortcut (.lnk) files.
+
+    Talks to the WScript.Shell COM object directly via pywin32 — no
+    PowerShell subprocess, no .NET startup, and no fragile path
+    interpolation into a script string. Falls back to a single batched
+    PowerShell run if pywin32 isn't available.
+    """
+    try:
+        from win32com.client import Dispatch
+    except ImportError:
+        _create_shortcuts_powershell(specs)
+        return
+
+    shell = Dispatch("WScript.Shell")
+    for spec in specs:
+        shortcut = shell.CreateShortcut(spec["shortcut_path"])
+        shortcut.TargetPath = spec["target"]
+        shortcut.Arguments = spec["arguments"]
+        shortcut.WorkingDirectory = spec["working_dir"]
+        shortcut.Description = spec["description"]
+        if spec.get("icon_path"):
+            shortcut.IconLocation = spec["icon_path"]
+        shortcut.Save()
+
+
+def _create_shortcuts_powershell(specs: list[dict]) -> None:
+    """Fallback: create all shortcuts in one batched PowerShell run.
+
+    Each PowerShell.exe startup costs ~500ms cold; batching all shortcuts
+    into a single script spawns the process (and the COM object) once.
+    """
+    import subprocess
+
+    ps_script = "$WshShell = New-Object -ComObject WScript.Shell\n"
+    for spec in specs:
+        ps_script += _shortcut_block(**spec)
 
     subprocess.run(
         ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_script],
@@ -43,6 +80,25 @@ $Shortcut.Description = "{description}"
     )
 
 
+def create_shortcut(
+    shortcut_path: str,
+    target: str,
+    arguments: str,
+    working_dir: str,
+    description: str,
+    icon_path: str | None = None,
+) -> None:
+    """Create a single Windows shortcut (.lnk) file."""
+    create_shortcuts([{
+        "shortcut_path": shortcut_path,
+        "target": target,
+        "arguments": arguments,
+        "working_dir": working_dir,
+        "description": description,
+        "icon_path": icon_path,
+    }])
+
+
 def main():
     project_dir = Path(__file__).parent.resolve()
     python_path = get_python_path()
@@ -53,58 +109,46 @@ def main():
     print("=" * 50)
     print()
 
+    description = "Review and clean files created during your session"
+    base_spec = {
+        "target": python_path,
+        "arguments": "-m sessionclean",
+        "working_dir": str(project_dir),
+        "description": description,
+    }
+
+    # Collect all shortcut locations, then create them in one PowerShell run.
     # 1. Start Menu shortcut
     start_menu = Path(os.environ.get("APPDATA", "")) / "Microsoft" / "Windows" / "Start Menu" / "Programs"
     start_shortcut = str(start_menu / "SessionClean.lnk")
 
-    print(f"[1/3] Creating Start Menu shortcut...")
-    try:
-        create_shortcut(
-            shortcut_path=start_shortcut,
-            target=python_path,
-            arguments=f'-m sessionclean',
-            working_dir=str(project_dir),
-            description="Review and clean files created during your session",
-        )
-        print(f"  ✅ Start Menu: {start_shortcut}")
-    except Exception as e:
-        print(f"  ❌ Failed: {e}")
-
     # 2. Desktop shortcut
     desktop = Path.home() / "Desktop"
     desktop_shortcut = str(desktop / "SessionClean.lnk")
 
-    print(f"[2/3] Creating Desktop shortcut...")
-    try:
-        create_shortcut(
-            shortcut_path=desktop_shortcut,
-            target=python_path,
-            arguments=f'-m sessionclean',
-            working_dir=str(project_dir),
-            description="Review and clean files created during your session",
-        )
-        print(f"  ✅ Desktop: {desktop_shortcut}")
-    except Exception as e:
-        print(f"  ❌ Failed: {e}")
+    specs = [
+        {"shortcut_path": start_shortcut, **base_spec},
+        {"shortcut_path": desktop_shortcut, **base_spec},
+    ]
 
     # 3. Taskbar pin (copy to taskbar folder)
     taskbar_dir = Path(os.environ.get("APPDATA", "")) / "Microsoft" / "Internet Explorer" / "Quick Launch" / "User Pinned" / "TaskBar"
-
-    print(f"[3/3] Creating Taskbar shortcut...")
+    taskbar_shortcut = None
     if taskbar_dir.exists():
         taskbar_shortcut = str(taskbar_dir / "SessionClean.lnk")
-        try:
-            create_shortcut(
-                shortcut_path=taskbar_shortcut,
-                target=python_path,
-                arguments=f'-m sessionclean',
-                working_dir=str(project_dir),
-                description="Review and clean files created during your session",
-            )
+        specs.append({"shortcut_path": taskbar_shortcut, **base_spec})
+
+    print(f"Creating {len(specs)} shortcuts...")
+    try:
+        create_shortcuts(specs)
+        print(f"  ✅ Start Menu: {start_shortcut}")
+        print(f"  ✅ Desktop: {desktop_shortcut}")
+        if taskbar_shortcut:
             print(f"  ✅ Taskbar: {taskbar_shortcut}")
-        except Exception as e:
-            print(f"  ❌ Failed: {e}")
-    else:
+    except Exception as e:
+        print(f"  ❌ Failed: {e}")
+
+    if taskbar_shortcut is None:
         print("  ⚠️  Taskbar folder not found. Right-click the Desktop shortcut")
         print("      and select 'Pin to taskbar' manually.")
 
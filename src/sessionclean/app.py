@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import logging
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 import customtkinter as ctk
 
@@ -12,14 +17,15 @@ from sessionclean.config import AppConfig
 from sessionclean.constants import APP_DIR, INTERRUPTED_FLAG
 from sessionclean.database import SnapshotDatabase
 from sessionclean.filter_engine import FilterEngine
-from sessionclean.gui.cleanup_window import CleanupWindow
-from sessionclean.gui.config_window import ConfigWindow
 from sessionclean.monitor import FileMonitor
 from sessionclean.scanner import Scanner
 from sessionclean.shutdown_hook import ShutdownHook
 from sessionclean.tray import TrayIcon
 from sessionclean.utils.logging_setup import setup_logging
 
+if TYPE_CHECKING:
+    from sessionclean.gui.cleanup_window import CleanupWindow
+
 logger = logging.getLogger("sessionclean")
 
 
@@ -35,25 +41,50 @@ class SessionCleanApp:
     """
 
     def __init__(self) -> None:
-        setup_logging()
-        logger.info("Starting %s v%s", __app_name__, __version__)
-
-        self._config = AppConfig.load()
-        self._db = SnapshotDatabase()
-        self._filter = FilterEngine(self._config)
-        self._scanner = Scanner(self._config, self._db, self._filter)
         self._monitor: FileMonitor | None = None
         self._tray: TrayIcon | None = None
         self._shutdown_hook: ShutdownHook | None = None
         self._root: ctk.CTk | None = None
         self._cleanup_window: CleanupWindow | None = None
+        self._cleanup_is_shutdown = False
         self._tray_update_interval = 5000  # ms
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._ui_queue_interval = 50  # ms
+        self._cached_new_files_count = 0
+        self._new_files_cache: tuple[tuple[int, int], list[dict]] | None = None
+        # Bounded pool for one-shot blocking I/O (scan, DB fetches) —
+        # results come back through the UI queue rather than raw threads
+        # each marshaling into Tk on their own.
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="IOWorker")
+
+    # ------------------------------------------------------------------
+    # Lazily constructed subsystems
+    # ------------------------------------------------------------------
+    # Nothing does config-file I/O, SQLite setup, or filter compilation
+    # until first access inside run() — keeps __init__ cheap on cold start.
+    @cached_property
+    def _config(self) -> AppConfig:
+        return AppConfig.load()
+
+    @cached_property
+    def _db(self) -> SnapshotDatabase:
+        return SnapshotDatabase()
+
+    @cached_property
+    def _filter(self) -> FilterEngine:
+        return FilterEngine(self._config)
+
+    @cached_property
+    def _scanner(self) -> Scanner:
+        return Scanner(self._config, self._db, self._filter)
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
     def run(self) -> None:
         """Start all subsystems and enter the main loop."""
+        setup_logging()
+        logger.info("Starting %s v%s", __app_name__, __version__)
         APP_DIR.mkdir(parents=True, exist_ok=True)
         self._check_interrupted_flag()
 
@@ -70,11 +101,13 @@ class SessionCleanApp:
         self._start_tray()
         self._start_scan_and_monitor()
 
-        # Periodic tray update
-        self._schedule_tray_update()
+        # Periodic tray update (DB polled off the Tk thread)
+        self._start_count_poller()
 
-        # Auto-open the review window after a short delay (let scan start first)
-        self._root.after(2000, lambda: self._show_cleanup(is_shutdown=False))
+        # Drain background-thread messages onto the Tk thread. The review
+        # window opens when the scan reports completion instead of after an
+        # arbitrary fixed delay.
+        self._root.after(self._ui_queue_interval, self._drain_ui_queue)
 
         logger.info("All subsystems started. Entering main loop.")
         self._root.mainloop()
@@ -121,8 +154,11 @@ class SessionCleanApp:
         """Start the snapshot scan in background, then start the file monitor."""
 
         def _scan_then_monitor():
+            count = 0
             try:
-                count = self._scanner.take_snapshot()
+                count = self._scanner.take_snapshot(
+                    on_progress=lambda n: self._ui_queue.put(("scan_progress", n))
+                )
                 logger.info("Snapshot complete: %d files", count)
             except Exception as exc:
                 logger.error("Snapshot scan failed: %s", exc)
@@ -135,28 +171,57 @@ class SessionCleanApp:
                 scan_start_time=self._scanner.scan_start_time,
             )
             self._monitor.start()
+            self._ui_queue.put(("scan_done", count))
 
-        scan_thread = threading.Thread(
-            target=_scan_then_monitor,
-            name="Scanner",
-            daemon=True,
-        )
-        scan_thread.start()
+        self._io_pool.submit(_scan_then_monitor)
 
     # ------------------------------------------------------------------
     # Periodic updates
     # ------------------------------------------------------------------
-    def _schedule_tray_update(self) -> None:
-        """Periodically update the tray icon with the current file count."""
-        if self._tray and self._db:
-            try:
-                count = self._db.get_new_files_count()
-                self._tray.update_status(count)
-            except Exception:
-                pass
+    def _start_count_poller(self) -> None:
+        """Poll the new-files count on a worker thread.
+
+        The SQLite query never runs on the Tk thread; only the cached
+        integer crosses over via the UI queue, and only when it changed
+        (so the tray icon isn't redrawn needlessly).
+        """
+
+        def _poll():
+            while True:
+                try:
+                    count = self._db.get_new_files_count()
+                    if count != self._cached_new_files_count:
+                        self._cached_new_files_count = count
+                        self._ui_queue.put(("file_count", count))
+                except Exception:
+                    pass
+                time.sleep(self._tray_update_interval / 1000)
+
+        threading.Thread(target=_poll, name="TrayCountPoller", daemon=True).start()
+
+    def _drain_ui_queue(self) -> None:
+        """Pop pending background-thread messages and act on the Tk thread."""
+        try:
+            while True:
+                kind, payload = self._ui_queue.get_nowait()
+                if kind == "scan_done":
+                    if self._tray:
+                        self._tray.scan_finished()
+                    self._show_cleanup(is_shutdown=False)
+                elif kind == "new_files":
+                    files, is_shutdown = payload
+                    self._open_cleanup_window(files, is_shutdown)
+                elif kind == "file_count":
+                    if self._tray:
+                        self._tray.update_status(payload)
+                elif kind == "scan_progress":
+                    if self._tray:
+                        self._tray.update_scan_progress(payload)
+        except queue.Empty:
+            pass
 
         if self._root:
-            self._root.after(self._tray_update_interval, self._schedule_tray_update)
+            self._root.after(self._ui_queue_interval, self._drain_ui_queue)
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -166,18 +231,18 @@ class SessionCleanApp:
         logger.info("Shutdown requested — preparing review")
         # Schedule UI on the main thread
         if self._root:
-            self._root.after(0, lambda: self._show_cleanup(is_shutdown=True))
+            self._root.after_idle(lambda: self._show_cleanup(is_shutdown=True))
 
     def _on_review_now(self) -> None:
         """Called from tray menu 'Review Files Now'."""
         logger.info("Manual review requested")
         if self._root:
-            self._root.after(0, lambda: self._show_cleanup(is_shutdown=False))
+            self._root.after_idle(lambda: self._show_cleanup(is_shutdown=False))
 
     def _on_open_settings(self) -> None:
         """Called from tray menu 'Settings...'."""
         if self._root:
-            self._root.after(0, self._show_settings)
+            self._root.after_idle(self._show_settings)
 
     def _on_exit(self) -> None:
         """Called from tray menu 'Exit'."""
@@ -191,8 +256,9 @@ class SessionCleanApp:
         """Show the cleanup window with all new files."""
         if self._cleanup_window is not None:
             try:
-                self._cleanup_window.focus()
-                return
+                if self._cleanup_window.winfo_viewable():
+                    self._cleanup_window.focus()
+                    return
             except Exception:
                 self._cleanup_window = None
 
@@ -200,30 +266,62 @@ class SessionCleanApp:
         if self._monitor:
             self._monitor.stop()
 
-        new_files = self._db.get_all_new_files()
+        # Fetch the file list off the Tk thread — the query can stall for
+        # seconds on slow disks while the scanner is still writing.
+        def _fetch():
+            # Repeated shows while nothing changed (e.g. re-opening during a
+            # shutdown in progress) reuse the cached list instead of
+            # re-querying and re-materializing the rows. The configured
+            # display cap bounds what the review window materializes;
+            # anything beyond it stays tracked for the next review.
+            cache_key = (self._db.change_version(), self._config.max_file_display)
+            if self._new_files_cache is not None and self._new_files_cache[0] == cache_key:
+                new_files = self._new_files_cache[1]
+            else:
+                new_files = list(
+                    self._db.iter_new_files(limit=self._config.max_file_display)
+                )
+                self._new_files_cache = (cache_key, new_files)
+            self._ui_queue.put(("new_files", (new_files, is_shutdown)))
+
+        self._io_pool.submit(_fetch)
+
+    def _open_cleanup_window(self, new_files: list[dict], is_shutdown: bool) -> None:
+        """Show the cleanup window on the Tk thread with pre-fetched rows.
+
+        The window is created once and kept alive (hidden) between shows;
+        rebuilding the full CTk widget tree on every review is expensive.
+        """
         logger.info("Showing cleanup window with %d files", len(new_files))
+        self._cleanup_is_shutdown = is_shutdown
 
-        # Keep root hidden but ensure it exists for toplevel windows
-        self._root.deiconify()
-        self._root.withdraw()
+        # Deferred import: the review window (and send2trash) only load the
+        # first time a review is actually shown.
+        from sessionclean.gui.cleanup_window import CleanupWindow
 
-        self._cleanup_window = CleanupWindow(
-            new_files=new_files,
-            on_complete=lambda keep, delete: self._on_cleanup_complete(
-                keep, delete, is_shutdown
-            ),
-            is_shutdown=is_shutdown,
-        )
+        if self._cleanup_window is not None:
+            self._cleanup_window.refresh(new_files, is_shutdown=is_shutdown)
+            self._cleanup_window.deiconify()
+        else:
+            self._cleanup_window = CleanupWindow(
+                new_files=new_files,
+                on_complete=lambda keep, delete: self._on_cleanup_complete(
+                    keep, delete, self._cleanup_is_shutdown
+                ),
+                is_shutdown=is_shutdown,
+                master=self._root,
+            )
         # Force the cleanup window to appear on top
         self._cleanup_window.after(100, self._cleanup_window.lift)
 
     def _show_settings(self) -> None:
         """Show the settings window."""
-        self._root.deiconify()
-        self._root.withdraw()
+        from sessionclean.gui.config_window import ConfigWindow
+
         ConfigWindow(
             config=self._config,
             on_save=self._on_config_saved,
+            master=self._root,
         )
 
     # ------------------------------------------------------------------
@@ -236,7 +334,7 @@ class SessionCleanApp:
         logger.info(
             "Cleanup complete: %d kept, %d deleted", len(keep), len(delete)
         )
-        self._cleanup_window = None
+        # The window hid itself; keep the instance for the next review.
         self._root.withdraw()
 
         if is_shutdown:
@@ -278,6 +376,11 @@ class SessionCleanApp:
         """Gracefully shut down all subsystems."""
         logger.info("Shutting down %s", __app_name__)
 
+        # Unblock any in-flight scan first — executor workers are
+        # non-daemon and the interpreter joins them at exit, so without
+        # cancellation "Exit" would hang until the walk finishes.
+        self._scanner.cancel()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
         if self._monitor:
             self._monitor.stop()
         if self._tray:
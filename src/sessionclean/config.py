@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+import mmap
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson  # optional: parses bytes directly, no intermediate str
+except ImportError:
+    orjson = None
+
 from sessionclean.constants import (
     APP_DIR,
     CONFIG_PATH,
@@ -17,6 +27,19 @@ from sessionclean.constants import (
 
 logger = logging.getLogger("sessionclean")
 
+# exists() results cached briefly — get_active_paths is hit from UI refresh
+# paths and each check is a stat syscall (potentially a slow one on
+# spun-down removable media).
+_EXISTS_TTL = 1.0
+_exists_cache: dict[str, tuple[float, bool]] = {}
+_exists_refreshing: set[str] = set()
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_cached(path: str) -> str:
+    """Resolve a path string once; resolve() walks the filesystem each call."""
+    return str(Path(path).resolve())
+
 
 @dataclass
 class MonitoredPath:
@@ -28,8 +51,36 @@ class MonitoredPath:
     is_removable: bool = False  # True for external / USB drives
 
     def exists(self) -> bool:
-        """Check if the path is currently accessible."""
-        return Path(self.path).exists()
+        """Check if the path is currently accessible (cached for 1s).
+
+        Removable drives can block a stat for hundreds of ms while spun-down
+        media wakes; for those, a stale cache entry is served immediately
+        and refreshed on a background thread instead of stalling the caller.
+        """
+        now = time.monotonic()
+        cached = _exists_cache.get(self.path)
+        if cached is not None and now - cached[0] < _EXISTS_TTL:
+            return cached[1]
+
+        if self.is_removable and cached is not None:
+            if self.path not in _exists_refreshing:
+                _exists_refreshing.add(self.path)
+                threading.Thread(
+                    target=self._refresh_exists, daemon=True
+                ).start()
+            return cached[1]
+
+        result = Path(self.path).exists()
+        _exists_cache[self.path] = (now, result)
+        return result
+
+    def _refresh_exists(self) -> None:
+        """Background refresh of the exists cache for removable media."""
+        try:
+            result = Path(self.path).exists()
+            _exists_cache[self.path] = (time.monotonic(), result)
+        finally:
+            _exists_refreshing.discard(self.path)
 
 
 @dataclass
@@ -57,7 +108,7 @@ class AppConfig:
             return config
 
         try:
-            raw = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+            raw = cls._read_config_json()
             monitored = [MonitoredPath(**mp) for mp in raw.get("monitored_paths", [])]
             return cls(
                 monitored_paths=monitored,
@@ -68,20 +119,53 @@ class AppConfig:
                 recycle_bin_days=raw.get("recycle_bin_days", RECYCLE_BIN_RETENTION_DAYS),
                 theme=raw.get("theme", "dark"),
             )
-        except (json.JSONDecodeError, TypeError, KeyError) as exc:
+        except (ValueError, TypeError, KeyError) as exc:
+            # ValueError covers both json's and orjson's decode errors
             logger.error("Failed to parse config: %s. Using defaults.", exc)
             config = cls.get_defaults()
             config.save()
             return config
 
+    @staticmethod
+    def _read_config_json() -> dict:
+        """Read and parse the config file.
+
+        Large files (big ignored-lists) are memory-mapped and handed to the
+        parser as a buffer, skipping the intermediate full-copy read; small
+        files take the plain read path.
+        """
+        with open(CONFIG_PATH, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if orjson is not None and size > 1 << 20:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # orjson accepts bytes/memoryview, not the mmap itself
+                    return orjson.loads(memoryview(mm))
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data.decode("utf-8"))
+
     def save(self) -> None:
         """Persist current config to disk."""
         APP_DIR.mkdir(parents=True, exist_ok=True)
-        data = asdict(self)
-        CONFIG_PATH.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        # asdict() deep-copies every field reflectively; save runs on every
+        # settings change, so build the dict directly.
+        data = {
+            "monitored_paths": [vars(mp) for mp in self.monitored_paths],
+            "ignored_extensions": self.ignored_extensions,
+            "ignored_directories": self.ignored_directories,
+            "show_hidden_files": self.show_hidden_files,
+            "max_file_display": self.max_file_display,
+            "recycle_bin_days": self.recycle_bin_days,
+            "theme": self.theme,
+        }
+        if orjson is not None:
+            CONFIG_PATH.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            CONFIG_PATH.write_text(
+                json.dumps(data, indent=2, ensure_ascii=False),
+                encoding="utf-8",
+            )
         logger.info("Config saved to %s", CONFIG_PATH)
 
     # ------------------------------------------------------------------
@@ -101,13 +185,23 @@ class AppConfig:
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _resolved_set(self) -> set[str]:
+        """Resolved forms of all monitored paths, built once and kept in
+        sync by add_path/remove_path (duplicate checks stay O(1))."""
+        cached = getattr(self, "_resolved_cache", None)
+        if cached is None:
+            cached = {_resolve_cached(mp.path) for mp in self.monitored_paths}
+            self._resolved_cache = cached
+        return cached
+
     def add_path(self, path: str, recursive: bool = True, is_removable: bool = False) -> None:
         """Add a new monitored path if it doesn't already exist."""
-        normalized = str(Path(path).resolve())
-        for mp in self.monitored_paths:
-            if str(Path(mp.path).resolve()) == normalized:
-                logger.warning("Path already monitored: %s", path)
-                return
+        normalized = _resolve_cached(path)
+        resolved = self._resolved_set()
+        if normalized in resolved:
+            logger.warning("Path already monitored: %s", path)
+            return
+        resolved.add(normalized)
         self.monitored_paths.append(
             MonitoredPath(
                 path=normalized, recursive=recursive,
@@ -118,10 +212,11 @@ class AppConfig:
 
     def remove_path(self, path: str) -> None:
         """Remove a monitored path."""
-        normalized = str(Path(path).resolve())
+        normalized = _resolve_cached(path)
+        self._resolved_set().discard(normalized)
         self.monitored_paths = [
             mp for mp in self.monitored_paths
-            if str(Path(mp.path).resolve()) != normalized
+            if _resolve_cached(mp.path) != normalized
         ]
 
     def get_active_paths(self) -> list[MonitoredPath]:
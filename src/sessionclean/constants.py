@@ -27,7 +27,7 @@ DEFAULT_MONITORED_DIRS: list[str] = [
 # ---------------------------------------------------------------------------
 # File extensions to IGNORE (system / temp / build artifacts)
 # ---------------------------------------------------------------------------
-IGNORED_EXTENSIONS: set[str] = {
+IGNORED_EXTENSIONS: frozenset[str] = frozenset({
     # Temporary files
     ".tmp", ".temp", ".crdownload", ".partial", ".part", ".download",
     # Logs and traces
@@ -40,12 +40,12 @@ IGNORED_EXTENSIONS: set[str] = {
     ".pyc", ".pyo", ".o", ".obj", ".class",
     # Cache
     ".cache",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Directory names to IGNORE (case-insensitive comparison)
 # ---------------------------------------------------------------------------
-IGNORED_DIRECTORIES: set[str] = {
+IGNORED_DIRECTORIES: frozenset[str] = frozenset({
     "appdata",
     ".cache",
     "__pycache__",
@@ -67,12 +67,12 @@ IGNORED_DIRECTORIES: set[str] = {
     ".venv",
     "env",
     ".env",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Path fragments to IGNORE (matched anywhere in the full path, lowercase)
 # ---------------------------------------------------------------------------
-IGNORED_PATH_FRAGMENTS: set[str] = {
+IGNORED_PATH_FRAGMENTS: frozenset[str] = frozenset({
     "\\appdata\\local\\temp",
     "\\appdata\\local\\microsoft",
     "\\appdata\\local\\google\\chrome\\user data",
@@ -82,7 +82,7 @@ IGNORED_PATH_FRAGMENTS: set[str] = {
     "\\windows\\",
     "\\$recycle.bin\\",
     "\\system volume information\\",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Scanner settings
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+import os
 import sqlite3
 import threading
+from collections.abc import Iterable
+from itertools import islice
 from pathlib import Path
 
 from sessionclean.constants import APP_DIR, DB_PATH
@@ -22,6 +25,16 @@ class SnapshotDatabase:
         self._db_path = db_path
         self._local = threading.local()
         self._lock = threading.Lock()
+        # Bumped on every new_files mutation; lets callers cache query
+        # results and skip re-reading when nothing changed.
+        self._change_version = 0
+        # Interned directory ids: most snapshot paths share a handful of
+        # parents, so the directory string is stored once per directory.
+        self._dir_ids: dict[str, int] = {}
+        # Bounded memo for point lookups — the snapshot is frozen once the
+        # scan finishes, so verdicts for hot paths are stable. Invalidated
+        # on any snapshot write.
+        self._snapshot_query_cache: dict[str, bool] = {}
         APP_DIR.mkdir(parents=True, exist_ok=True)
 
     # ------------------------------------------------------------------
@@ -33,6 +46,13 @@ class SnapshotDatabase:
             conn = sqlite3.connect(str(self._db_path), timeout=10)
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            # mmap the DB so hot reads (is_in_snapshot during monitoring)
+            # skip the pager copy; 256 MiB covers even very large snapshots.
+            conn.execute("PRAGMA mmap_size=268435456")
+            # 64 MiB page cache (negative = KiB units) — the snapshot table
+            # can reach millions of rows.
+            conn.execute("PRAGMA cache_size=-65536")
             conn.row_factory = sqlite3.Row
             self._local.conn = conn
         return self._local.conn
@@ -42,13 +62,26 @@ class SnapshotDatabase:
     # ------------------------------------------------------------------
     def initialize(self) -> None:
         """Create tables and clear previous session data."""
+        self._prefault_db_file()
         conn = self._get_conn()
         conn.executescript("""
-            CREATE TABLE IF NOT EXISTS snapshot (
-                path    TEXT PRIMARY KEY,
-                mtime   REAL NOT NULL,
-                size    INTEGER NOT NULL
+            -- Snapshot data is regenerated every session, so the tables are
+            -- rebuilt here. Directory strings are interned into their own
+            -- table (stored once per directory instead of once per file);
+            -- WITHOUT ROWID keeps file rows directly in the PK B-tree.
+            DROP TABLE IF EXISTS snapshot;
+            DROP TABLE IF EXISTS snapshot_dirs;
+            CREATE TABLE snapshot_dirs (
+                id   INTEGER PRIMARY KEY,
+                dir  TEXT UNIQUE NOT NULL
             );
+            CREATE TABLE snapshot (
+                dir_id  INTEGER NOT NULL,
+                name    TEXT NOT NULL,
+                mtime   REAL NOT NULL,
+                size    INTEGER NOT NULL,
+                PRIMARY KEY (dir_id, name)
+            ) WITHOUT ROWID;
 
             CREATE TABLE IF NOT EXISTS new_files (
                 path        TEXT PRIMARY KEY,
@@ -57,12 +90,80 @@ class SnapshotDatabase:
                 file_type   TEXT NOT NULL DEFAULT ''
             );
 
-            DELETE FROM snapshot;
             DELETE FROM new_files;
         """)
         conn.commit()
+        with self._lock:
+            self._change_version += 1
+            self._dir_ids.clear()
+            self._snapshot_query_cache.clear()
         logger.info("Database initialized at %s", self._db_path)
 
+    def _prefault_db_file(self) -> None:
+        """Warm the OS page cache for an existing DB file.
+
+        Converts the scattered page faults of the first queries into one
+        sequential bulk read. posix_fadvise where available; elsewhere a
+        capped sequential read achieves the same warm cache.
+        """
+        if not self._db_path.exists():
+            return
+        try:
+            with open(self._db_path, "rb") as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(
+                        f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED
+                    )
+                else:
+                    remaining = 268435456  # match the mmap window
+                    while remaining > 0 and f.read(1 << 20):
+                        remaining -= 1 << 20
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Path interning helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _split_path(path: str) -> tuple[str, str]:
+        """Split a full path into (directory, name) on either separator."""
+        cut = max(path.rfind("\\"), path.rfind("/"))
+        if cut <= 0:
+            return "", path
+        return path[:cut], path[cut + 1:]
+
+    def _dir_id(self, conn: sqlite3.Connection, directory: str) -> int:
+        """Look up or insert a directory, caching the id. Caller holds _lock."""
+        dir_id = self._dir_ids.get(directory)
+        if dir_id is None:
+            row = conn.execute(
+                "SELECT id FROM snapshot_dirs WHERE dir = ?", (directory,)
+            ).fetchone()
+            if row is None:
+                cursor = conn.execute(
+                    "INSERT INTO snapshot_dirs (dir) VALUES (?)", (directory,)
+                )
+                dir_id = cursor.lastrowid
+            else:
+                dir_id = row[0]
+            if len(self._dir_ids) >= 100_000:
+                self._dir_ids.clear()
+            self._dir_ids[directory] = dir_id
+        return dir_id
+
+    def _lookup_dir_id(self, conn: sqlite3.Connection, directory: str) -> int | None:
+        """Read-only directory lookup for query paths (no insert)."""
+        dir_id = self._dir_ids.get(directory)
+        if dir_id is None:
+            row = conn.execute(
+                "SELECT id FROM snapshot_dirs WHERE dir = ?", (directory,)
+            ).fetchone()
+            if row is None:
+                return None
+            dir_id = row[0]
+            self._dir_ids[directory] = dir_id
+        return dir_id
+
     # ------------------------------------------------------------------
     # Snapshot operations
     # ------------------------------------------------------------------
@@ -72,18 +173,103 @@ class SnapshotDatabase:
         Uses INSERT OR IGNORE to skip duplicates.
         """
         conn = self._get_conn()
+        split = self._split_path
         with self._lock:
+            rows = []
+            for path, mtime, size in file_records:
+                directory, name = split(path)
+                rows.append((self._dir_id(conn, directory), name, mtime, size))
             conn.executemany(
-                "INSERT OR IGNORE INTO snapshot (path, mtime, size) VALUES (?, ?, ?)",
-                file_records,
+                "INSERT OR IGNORE INTO snapshot (dir_id, name, mtime, size)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
             )
             conn.commit()
+            self._snapshot_query_cache.clear()
+
+    def store_snapshot_batch_columns(
+        self,
+        paths: list[str],
+        mtimes: Iterable[float],
+        sizes: Iterable[int],
+    ) -> None:
+        """Column-oriented variant of store_snapshot_batch.
+
+        Accepts three parallel sequences (e.g. compact array.array buffers
+        from the scanner) and zips them straight into executemany without
+        materializing per-row tuples upstream.
+        """
+        conn = self._get_conn()
+        split = self._split_path
+        with self._lock:
+            rows = []
+            for path, mtime, size in zip(paths, mtimes, sizes):
+                directory, name = split(path)
+                rows.append((self._dir_id(conn, directory), name, mtime, size))
+            conn.executemany(
+                "INSERT OR IGNORE INTO snapshot (dir_id, name, mtime, size)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+            self._snapshot_query_cache.clear()
 
     def is_in_snapshot(self, path: str) -> bool:
-        """Check if a file existed at startup."""
+        """Check if a file existed at startup (memoized point lookup)."""
+        cached = self._snapshot_query_cache.get(path)
+        if cached is not None:
+            return cached
+
+        conn = self._get_conn()
+        directory, name = self._split_path(path)
+        dir_id = self._lookup_dir_id(conn, directory)
+        if dir_id is None:
+            result = False
+        else:
+            row = conn.execute(
+                "SELECT 1 FROM snapshot WHERE dir_id = ? AND name = ?",
+                (dir_id, name),
+            ).fetchone()
+            result = row is not None
+
+        if len(self._snapshot_query_cache) >= 8192:
+            self._snapshot_query_cache.clear()
+        self._snapshot_query_cache[path] = result
+        return result
+
+    def is_in_snapshot_many(self, paths: Iterable[str]) -> set[str]:
+        """Return the subset of the given paths that existed at startup.
+
+        One chunked IN-query per ~900 paths instead of a round-trip per
+        path (900 stays under SQLite's bound-parameter limit).
+        """
+        result: set[str] = set()
         conn = self._get_conn()
-        row = conn.execute("SELECT 1 FROM snapshot WHERE path = ?", (path,)).fetchone()
-        return row is not None
+
+        # Group by parent directory so each group resolves one dir_id and
+        # queries only names.
+        by_dir: dict[str, dict[str, str]] = {}
+        for path in paths:
+            directory, name = self._split_path(path)
+            by_dir.setdefault(directory, {})[name] = path
+
+        for directory, names in by_dir.items():
+            dir_id = self._lookup_dir_id(conn, directory)
+            if dir_id is None:
+                continue
+            it = iter(names)
+            while True:
+                chunk = list(islice(it, 900))
+                if not chunk:
+                    break
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT name FROM snapshot WHERE dir_id = ?"
+                    f" AND name IN ({placeholders})",
+                    [dir_id, *chunk],
+                )
+                result.update(names[row[0]] for row in rows)
+        return result
 
     def get_snapshot_count(self) -> int:
         """Return the total number of files in the snapshot."""
@@ -104,35 +290,76 @@ class SnapshotDatabase:
                 (path, size, created_at, file_type),
             )
             conn.commit()
+            self._change_version += 1
         logger.debug("Recorded new file: %s (%d bytes)", path, size)
 
+    def record_new_files_batch(
+        self, rows: list[tuple[str, int, float, str]]
+    ) -> None:
+        """Bulk insert session files in one transaction.
+
+        rows: [(path, size, created_at, file_type), ...]. A single commit
+        amortizes the fsync across the whole burst.
+        """
+        if not rows:
+            return
+        conn = self._get_conn()
+        with self._lock:
+            conn.executemany(
+                """INSERT OR REPLACE INTO new_files (path, size, created_at, file_type)
+                   VALUES (?, ?, ?, ?)""",
+                rows,
+            )
+            conn.commit()
+            self._change_version += 1
+        logger.debug("Recorded %d new files in one batch", len(rows))
+
     def remove_new_file(self, path: str) -> None:
         """Remove from new_files if a tracked file was deleted during the session."""
         conn = self._get_conn()
         with self._lock:
             conn.execute("DELETE FROM new_files WHERE path = ?", (path,))
             conn.commit()
+            self._change_version += 1
         logger.debug("Removed tracked file: %s", path)
 
-    def get_all_new_files(self) -> list[dict]:
-        """Return all files created during this session as a list of dicts."""
+    def iter_new_files(self, limit: int | None = None, offset: int = 0):
+        """Stream session files newest-first, optionally windowed.
+
+        Yields dicts lazily so callers that only need the visible slice
+        (the GUI caps display at MAX_FILE_DISPLAY) never materialize the
+        rest. Name/directory are split with plain string ops — two pathlib
+        objects per row is measurable on large sessions, and rfind handles
+        the stored Windows separators regardless of host platform.
+        """
         conn = self._get_conn()
-        rows = conn.execute(
-            """SELECT path, size, created_at, file_type
-               FROM new_files
-               ORDER BY created_at DESC"""
-        ).fetchall()
-        return [
-            {
-                "path": row["path"],
-                "name": Path(row["path"]).name,
-                "size": row["size"],
-                "created_at": row["created_at"],
-                "file_type": row["file_type"],
-                "directory": str(Path(row["path"]).parent),
+        sql = (
+            "SELECT path, size, created_at, file_type FROM new_files"
+            " ORDER BY created_at DESC"
+        )
+        params: tuple = ()
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = (limit, offset)
+        for path, size, created_at, file_type in conn.execute(sql, params):
+            cut = max(path.rfind("\\"), path.rfind("/"))
+            yield {
+                "path": path,
+                "name": path[cut + 1:],
+                "size": size,
+                "created_at": created_at,
+                "file_type": file_type,
+                "directory": path[:cut] if cut > 0 else "",
             }
-            for row in rows
-        ]
+
+    def get_all_new_files(self) -> list[dict]:
+        """Return all files created during this session as a list of dicts."""
+        return list(self.iter_new_files())
+
+    def change_version(self) -> int:
+        """Monotonic counter of new_files mutations (for caching queries)."""
+        with self._lock:
+            return self._change_version
 
     def get_new_files_count(self) -> int:
         """Return the number of new files tracked this session."""
@@ -8,13 +8,15 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
+import tkinter as tk
 from collections.abc import Callable
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import customtkinter as ctk
 from send2trash import send2trash
 
-from sessionclean.gui.widgets import COLORS, EmptyStateWidget
+from sessionclean.gui.widgets import COLORS, EmptyStateWidget, shared_font
 from sessionclean.utils.file_utils import format_size, get_file_category
 
 logger = logging.getLogger("sessionclean")
@@ -43,10 +45,13 @@ class CleanupWindow(ctk.CTkToplevel):
         super().__init__(**kwargs)
 
         self._all_files = new_files
+        self._precompute_fields(new_files)
         self._on_complete = on_complete
         self._is_shutdown = is_shutdown
         self._check_vars: dict[str, ctk.BooleanVar] = {}
         self._selected_file: dict | None = None
+        self._last_preview_status: bool | None = None
+        self._alive = True
 
         self.title("SessionClean")
         self.geometry("950x580")
@@ -60,6 +65,58 @@ class CleanupWindow(ctk.CTkToplevel):
         else:
             self._build_ui()
 
+    def _precompute_fields(self, files: list[dict]) -> None:
+        """Cache per-file display strings (and the size total) at ingestion.
+
+        The row builder, preview panel, and summary all need the category
+        and formatted size; computing them per render call adds up.
+        """
+        total_size = 0
+        icon_for = CATEGORY_ICONS.get
+        for file_info in files:
+            category = get_file_category(file_info["path"])
+            file_info["_cat"] = category
+            file_info["_icon"] = icon_for(category, "📁")
+            file_info["_size_str"] = format_size(file_info["size"])
+            total_size += file_info.get("size", 0)
+            # time.strftime over localtime skips datetime object
+            # construction entirely (C-level path).
+            created = time.localtime(file_info["created_at"])
+            file_info["_time_str"] = time.strftime("%I:%M %p", created)
+            file_info["_created_str"] = time.strftime(
+                "%Y-%m-%d  %I:%M %p", created
+            )
+        self._total_size = total_size
+
+    # ------------------------------------------------------------------
+    # Reuse across shows
+    # ------------------------------------------------------------------
+    def refresh(self, new_files: list[dict], is_shutdown: bool = False) -> None:
+        """Repopulate the window with a new file list.
+
+        Rebuilding content in place is much cheaper than destroying and
+        reconstructing the whole Toplevel (CTk widgets are canvas-drawn).
+        """
+        self._all_files = new_files
+        self._precompute_fields(new_files)
+        self._is_shutdown = is_shutdown
+        self._check_vars = {}
+        self._selected_file = None
+        self._last_preview_status = None
+        self._alive = True
+
+        for widget in self.winfo_children():
+            widget.destroy()
+
+        if not new_files:
+            self._show_empty_state()
+        else:
+            self._build_ui()
+
+    def hide(self) -> None:
+        """Withdraw the window, keeping the widget tree alive for reuse."""
+        self.withdraw()
+
     # ------------------------------------------------------------------
     # Empty state
     # ------------------------------------------------------------------
@@ -68,7 +125,7 @@ class CleanupWindow(ctk.CTkToplevel):
         btn_text = "Shut Down" if self._is_shutdown else "Close"
         ctk.CTkButton(
             self, text=btn_text,
-            font=ctk.CTkFont(size=15, weight="bold"), height=45,
+            font=shared_font(15, "bold"), height=45,
             fg_color=COLORS["success_green"],
             hover_color=COLORS["keep_hover"],
             command=self._confirm_empty,
@@ -84,22 +141,21 @@ class CleanupWindow(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             header, text="🧹 What did you download today?",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=shared_font(18, "bold"),
             text_color=COLORS["text_primary"],
         ).pack(side="left")
 
-        total_size = sum(f.get("size", 0) for f in self._all_files)
         ctk.CTkLabel(
             header,
-            text=f"{len(self._all_files)} files · {format_size(total_size)}",
-            font=ctk.CTkFont(size=13),
+            text=f"{len(self._all_files)} files · {format_size(self._total_size)}",
+            font=shared_font(13),
             text_color=COLORS["text_secondary"],
         ).pack(side="right")
 
         ctk.CTkLabel(
             self,
             text="Checked = KEEP.  Uncheck what you want to delete.",
-            font=ctk.CTkFont(size=12),
+            font=shared_font(12),
             text_color=COLORS["text_muted"],
         ).pack(padx=20, anchor="w")
 
@@ -109,7 +165,7 @@ class CleanupWindow(ctk.CTkToplevel):
 
         ctk.CTkButton(
             actions, text="Keep All", width=80, height=28,
-            font=ctk.CTkFont(size=11),
+            font=shared_font(11),
             fg_color=COLORS["success_green"],
             hover_color=COLORS["keep_hover"],
             command=self._select_all,
@@ -117,7 +173,7 @@ class CleanupWindow(ctk.CTkToplevel):
 
         ctk.CTkButton(
             actions, text="Delete All", width=80, height=28,
-            font=ctk.CTkFont(size=11),
+            font=shared_font(11),
             fg_color=COLORS["neutral_border"],
             hover_color=COLORS["neutral_hover"],
             command=self._deselect_all,
@@ -125,7 +181,7 @@ class CleanupWindow(ctk.CTkToplevel):
 
         self._summary_label = ctk.CTkLabel(
             actions, text="",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=shared_font(12, "bold"),
             text_color=COLORS["success_green"],
         )
         self._summary_label.pack(side="right")
@@ -161,7 +217,7 @@ class CleanupWindow(ctk.CTkToplevel):
         )
         self._confirm_btn = ctk.CTkButton(
             self, text=btn_text,
-            font=ctk.CTkFont(size=14, weight="bold"), height=45,
+            font=shared_font(14, "bold"), height=45,
             fg_color=COLORS["success_green"],
             hover_color=COLORS["keep_hover"],
             command=self._confirm_and_close,
@@ -178,18 +234,18 @@ class CleanupWindow(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             p, text="File Preview",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=shared_font(14, "bold"),
             text_color=COLORS["text_secondary"],
         ).pack(pady=(15, 10))
 
         self._preview_icon = ctk.CTkLabel(
-            p, text="📁", font=ctk.CTkFont(size=48),
+            p, text="📁", font=shared_font(48),
         )
         self._preview_icon.pack(pady=(10, 5))
 
         self._preview_name = ctk.CTkLabel(
             p, text="Select a file to preview",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=shared_font(14, "bold"),
             text_color=COLORS["text_primary"], wraplength=250,
         )
         self._preview_name.pack(pady=(5, 10))
@@ -207,12 +263,12 @@ class CleanupWindow(ctk.CTkToplevel):
             row.pack(fill="x", pady=2)
             ctk.CTkLabel(
                 row, text=f"{label_text}:", width=70, anchor="w",
-                font=ctk.CTkFont(size=12),
+                font=shared_font(12),
                 text_color=COLORS["text_muted"],
             ).pack(side="left")
             val = ctk.CTkLabel(
                 row, text="—", anchor="w",
-                font=ctk.CTkFont(size=12),
+                font=shared_font(12),
                 text_color=COLORS["text_secondary"],
                 wraplength=200,
             )
@@ -221,14 +277,11 @@ class CleanupWindow(ctk.CTkToplevel):
 
     def _show_preview(self, file_info: dict) -> None:
         self._selected_file = file_info
-        category = get_file_category(file_info["path"])
-        icon = CATEGORY_ICONS.get(category, "📁")
+        category = file_info["_cat"]
 
-        self._preview_icon.configure(text=icon)
+        self._preview_icon.configure(text=file_info["_icon"])
         self._preview_name.configure(text=file_info["name"])
-        self._detail_labels["size"].configure(
-            text=format_size(file_info["size"])
-        )
+        self._detail_labels["size"].configure(text=file_info["_size_str"])
         self._detail_labels["type"].configure(
             text=f"{category} (.{file_info.get('file_type', '?')})"
         )
@@ -236,14 +289,20 @@ class CleanupWindow(ctk.CTkToplevel):
             text=file_info.get("directory", "")
         )
 
-        created_dt = datetime.fromtimestamp(file_info["created_at"])
         self._detail_labels["created"].configure(
-            text=created_dt.strftime("%Y-%m-%d  %I:%M %p")
+            text=file_info["_created_str"]
         )
 
-        is_kept = self._check_vars.get(
-            file_info["path"], ctk.BooleanVar(value=True)
-        ).get()
+        # Constructing a BooleanVar as the .get() default creates a Tcl
+        # variable per call; guard with None instead.
+        var = self._check_vars.get(file_info["path"])
+        is_kept = var.get() if var is not None else self._default_keep
+        self._update_status_label(is_kept)
+
+    def _update_status_label(self, is_kept: bool) -> None:
+        """Touch only the preview status line (the rest doesn't change on
+        checkbox toggles)."""
+        self._last_preview_status = is_kept
         if is_kept:
             self._detail_labels["status"].configure(
                 text="✅ Keeping", text_color=COLORS["success_green"],
@@ -254,73 +313,236 @@ class CleanupWindow(ctk.CTkToplevel):
             )
 
     # ------------------------------------------------------------------
-    # File list
+    # File list (virtualized)
     # ------------------------------------------------------------------
-    def _render_file_list(self) -> None:
-        for file_info in self._all_files:
-            path = file_info["path"]
-            var = ctk.BooleanVar(value=True)  # Checked = keep
-            var.trace_add("write", lambda *_: self._update_summary())
-            self._check_vars[path] = var
-
-            row = ctk.CTkFrame(self._scroll, fg_color="transparent")
-            row.pack(fill="x", pady=1)
-
-            category = get_file_category(path)
-            icon = CATEGORY_ICONS.get(category, "📁")
-
-            ctk.CTkCheckBox(
-                row, text=f"{icon}  {file_info['name']}",
-                variable=var, font=ctk.CTkFont(size=13),
-                text_color=COLORS["text_primary"],
-            ).pack(side="left", padx=(8, 4), pady=4)
-
-            ctk.CTkLabel(
-                row, text=format_size(file_info["size"]),
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["text_muted"],
-            ).pack(side="right", padx=(0, 10))
+    # Only widgets for the visible viewport slice exist; a spacer frame
+    # reserves the scroll height and a small pool of row widgets is
+    # repositioned/reconfigured as the viewport moves. Widget count stays
+    # bounded by viewport height instead of growing with the file count.
+    ROW_HEIGHT = 36
 
-            created_dt = datetime.fromtimestamp(file_info["created_at"])
-            ctk.CTkLabel(
-                row, text=created_dt.strftime("%I:%M %p"),
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["text_muted"],
-            ).pack(side="right", padx=(0, 8))
+    # How many BooleanVars to register per scheduled chunk while building
+    VAR_CHUNK = 200
 
-            # Click to preview
-            handler = self._make_click_handler(file_info)
-            row.bind("<Button-1>", handler)
-            for child in row.winfo_children():
-                child.bind("<Button-1>", handler, add="+")
+    def _render_file_list(self) -> None:
+        # Running counters updated by per-checkbox delta callbacks — the
+        # summary never rescans the full file list.
+        self._keep_count = len(self._all_files)
+        self._delete_size = 0
+        self._bulk_update = False
+        self._default_keep = True
+        self._last_vals: dict[str, bool] = {}
+        self._summary_token: str | None = None
+        self._build_gen = getattr(self, "_build_gen", 0) + 1
+
+        # Registering a Tcl variable per file is the remaining O(N) work at
+        # open; create the first chunk synchronously (covers the visible
+        # page) and the rest in scheduled batches so the window paints
+        # immediately. _ensure_var covers rows scrolled to mid-build.
+        self._create_vars_chunk(0, self._build_gen)
+
+        self._row_pool: list[dict] = []
+        spacer = ctk.CTkFrame(
+            self._scroll, fg_color="transparent",
+            height=len(self._all_files) * self.ROW_HEIGHT,
+        )
+        spacer.pack(fill="x")
+
+        canvas = self._scroll._parent_canvas
+        canvas.bind("<Configure>", self._update_viewport, add="+")
+        # bind_all is application-level — register the wheel handler once
+        # per window, not once per refresh.
+        if not getattr(self, "_wheel_bound", False):
+            self._wheel_bound = True
+            for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                canvas.bind_all(seq, self._on_list_scroll, add="+")
+        self._scroll._scrollbar.configure(
+            command=lambda *args: (canvas.yview(*args), self._update_viewport())
+        )
+        self.bind_class("SessionCleanRow", "<Button-1>", self._on_row_click)
+        self.after_idle(self._update_viewport)
+
+    def _ensure_var(self, file_info: dict) -> ctk.BooleanVar:
+        """Get or lazily create the checkbox variable for a file."""
+        path = file_info["path"]
+        var = self._check_vars.get(path)
+        if var is None:
+            var = ctk.BooleanVar(value=self._default_keep)
+            self._check_vars[path] = var
+            self._last_vals[path] = self._default_keep
+            if not self._default_keep:
+                # A bulk Delete All ran before this var existed; fold the
+                # file into the counters now.
+                self._keep_count -= 1
+                self._delete_size += file_info["size"]
+            var.trace_add(
+                "write", self._make_trace_cb(path, file_info["size"])
+            )
+        return var
+
+    def _create_vars_chunk(self, start: int, gen: int) -> None:
+        if gen != self._build_gen:
+            return  # a refresh() superseded this build
+        end = min(start + self.VAR_CHUNK, len(self._all_files))
+        for file_info in self._all_files[start:end]:
+            self._ensure_var(file_info)
+        # A bulk toggle mid-build adjusts the counters through _ensure_var
+        # without refreshing the label; push each batch's convergence to it
+        # (coalesced through the idle token, so this is one refresh).
+        self._schedule_summary()
+        if end < len(self._all_files):
+            self.after(1, self._create_vars_chunk, end, gen)
+
+    def _make_pool_row(self) -> dict:
+        # Plain Tk widgets: CTk rows each embed a canvas that redraws
+        # rounded shapes on every reconfigure, which is the known CTk
+        # long-list bottleneck. Flat rows don't need the styling.
+        bg = COLORS["neutral_bg"]
+        frame = tk.Frame(self._scroll, bg=bg, height=self.ROW_HEIGHT)
+        # Children must not renegotiate the fixed row height on every
+        # reconfigure — keeps geometry work out of the scroll path.
+        frame.pack_propagate(False)
+        checkbox = tk.Checkbutton(
+            frame, text="", font=shared_font(13), anchor="w",
+            bg=bg, fg=COLORS["text_primary"],
+            activebackground=bg, activeforeground=COLORS["text_primary"],
+            selectcolor=bg, highlightthickness=0, bd=0,
+        )
+        checkbox.pack(side="left", padx=(8, 4), pady=4)
+        size_label = tk.Label(
+            frame, text="", font=shared_font(11),
+            bg=bg, fg=COLORS["text_muted"],
+        )
+        size_label.pack(side="right", padx=(0, 10))
+        time_label = tk.Label(
+            frame, text="", font=shared_font(11),
+            bg=bg, fg=COLORS["text_muted"],
+        )
+        time_label.pack(side="right", padx=(0, 8))
+
+        entry = {"frame": frame, "checkbox": checkbox,
+                 "size_label": size_label, "time_label": time_label,
+                 "index": -1}
+        frame._row_index = -1  # read by the delegated click handler
+        # One class-level binding fires for every widget carrying the
+        # "SessionCleanRow" bindtag — no per-widget bind calls or closures.
+        for widget in (frame, *frame.winfo_children()):
+            widget.bindtags(widget.bindtags() + ("SessionCleanRow",))
+        return entry
+
+    def _assign_row(self, entry: dict, index: int) -> None:
+        """Point a pooled row widget at self._all_files[index]."""
+        entry["index"] = index
+        entry["frame"]._row_index = index
+        file_info = self._all_files[index]
+        entry["checkbox"].configure(
+            text=f"{file_info['_icon']}  {file_info['name']}",
+            variable=self._ensure_var(file_info),
+        )
+        entry["size_label"].configure(text=file_info["_size_str"])
+        entry["time_label"].configure(text=file_info["_time_str"])
+        entry["frame"].place(
+            x=0, y=index * self.ROW_HEIGHT, relwidth=1.0, height=self.ROW_HEIGHT,
+        )
 
-    def _make_click_handler(self, fi: dict):
-        def handler(event):
-            self._show_preview(fi)
-        return handler
+    def _update_viewport(self, event=None) -> None:
+        """Materialize row widgets only for the visible index range."""
+        canvas = self._scroll._parent_canvas
+        try:
+            top = canvas.canvasy(0)
+            height = canvas.winfo_height()
+        except tk.TclError:
+            return  # canvas destroyed by a refresh between schedule and fire
+        first = max(0, int(top // self.ROW_HEIGHT))
+        last = min(len(self._all_files), first + height // self.ROW_HEIGHT + 2)
+
+        needed = last - first
+        while len(self._row_pool) < needed:
+            self._row_pool.append(self._make_pool_row())
+
+        for i, entry in enumerate(self._row_pool):
+            index = first + i
+            if index < last:
+                self._assign_row(entry, index)
+            else:
+                entry["index"] = -1
+                entry["frame"].place_forget()
+
+    def _on_list_scroll(self, *_) -> None:
+        # The wheel binding is application-wide and outlives refreshes; the
+        # canvas it targets may have been destroyed (e.g. refresh to the
+        # empty state).
+        try:
+            self._scroll._parent_canvas.after_idle(self._update_viewport)
+        except tk.TclError:
+            pass
+
+    def _on_row_click(self, event) -> None:
+        """Walk up from the clicked widget to its pooled row frame."""
+        widget = event.widget
+        while widget is not None and getattr(widget, "_row_index", None) is None:
+            widget = getattr(widget, "master", None)
+        if widget is None:
+            return
+        index = widget._row_index
+        if 0 <= index < len(self._all_files):
+            self._show_preview(self._all_files[index])
 
     # ------------------------------------------------------------------
     # Actions
     # ------------------------------------------------------------------
+    def _make_trace_cb(self, path: str, size: int):
+        """Build an O(1) trace callback that applies the toggle delta."""
+        def callback(*_):
+            new_val = self._check_vars[path].get()
+            if self._last_vals[path] == new_val:
+                return
+            self._last_vals[path] = new_val
+            if new_val:
+                self._keep_count += 1
+                self._delete_size -= size
+            else:
+                self._keep_count -= 1
+                self._delete_size += size
+            if not self._bulk_update:
+                self._schedule_summary()
+        return callback
+
+    def _schedule_summary(self) -> None:
+        """Coalesce summary refreshes into one idle callback."""
+        if self._summary_token is None:
+            self._summary_token = self.after_idle(self._flush_summary)
+
+    def _flush_summary(self) -> None:
+        self._summary_token = None
+        self._update_summary()
+
     def _select_all(self) -> None:
-        for var in self._check_vars.values():
-            var.set(True)
+        self._default_keep = True  # vars not yet created follow the bulk state
+        self._bulk_update = True
+        try:
+            for var in self._check_vars.values():
+                var.set(True)
+        finally:
+            self._bulk_update = False
+        self._schedule_summary()
 
     def _deselect_all(self) -> None:
-        for var in self._check_vars.values():
-            var.set(False)
+        self._default_keep = False
+        self._bulk_update = True
+        try:
+            for var in self._check_vars.values():
+                var.set(False)
+        finally:
+            self._bulk_update = False
+        self._schedule_summary()
 
     def _update_summary(self) -> None:
         if not hasattr(self, "_summary_label"):
             return
-        keeping = sum(1 for v in self._check_vars.values() if v.get())
+        keeping = self._keep_count
         deleting = len(self._all_files) - keeping
-        del_size = sum(
-            f["size"] for f in self._all_files
-            if not self._check_vars.get(
-                f["path"], ctk.BooleanVar(value=True)
-            ).get()
-        )
+        del_size = self._delete_size
         if deleting == 0:
             self._summary_label.configure(
                 text=f"✅ Keeping all {keeping} files",
@@ -332,19 +554,34 @@ class CleanupWindow(ctk.CTkToplevel):
                 text_color=COLORS["danger_red"],
             )
         if self._selected_file:
-            self._show_preview(self._selected_file)
+            # Only the status line can change on a toggle — skip the full
+            # six-label preview re-render, and skip even the status label
+            # when its value is unchanged.
+            var = self._check_vars.get(self._selected_file["path"])
+            is_kept = var.get() if var is not None else self._default_keep
+            if is_kept != self._last_preview_status:
+                self._update_status_label(is_kept)
 
     # ------------------------------------------------------------------
     # Confirm / Close
     # ------------------------------------------------------------------
     def _confirm_and_close(self) -> None:
-        keep = []
-        delete = []
+        # Single classification pass with the hot lookups hoisted out of
+        # the loop body.
+        keep: list[str] = []
+        delete: list[str] = []
+        keep_append = keep.append
+        delete_append = delete.append
+        get_var = self._check_vars.get
+        default_keep = self._default_keep
         for f in self._all_files:
-            if self._check_vars[f["path"]].get():
-                keep.append(f["path"])
+            path = f["path"]
+            var = get_var(path)
+            kept = var.get() if var is not None else default_keep
+            if kept:
+                keep_append(path)
             else:
-                delete.append(f["path"])
+                delete_append(path)
 
         if delete:
             self._confirm_btn.configure(
@@ -358,25 +595,62 @@ class CleanupWindow(ctk.CTkToplevel):
             self._finish(keep, delete)
 
     def _execute_deletions(self, keep: list[str], delete: list[str]) -> None:
-        deleted = []
-        for path in delete:
+        # Each send2trash call is a blocking shell operation; running them
+        # on a bounded pool overlaps their latencies (biggest win when the
+        # Recycle Bin lives on a slow or networked disk).
+        def _safe_trash(path: str) -> str | None:
             try:
                 send2trash(path)
-                deleted.append(path)
                 logger.info("Sent to Recycle Bin: %s", path)
+                return path
             except Exception as exc:
                 logger.error("Failed to delete %s: %s", path, exc)
-        self.after(0, lambda: self._finish(keep, deleted))
+                return None
+
+        total = len(delete)
+        deleted = []
+        done = 0
+        with ThreadPoolExecutor(max_workers=min(8, total)) as pool:
+            futures = [pool.submit(_safe_trash, path) for path in delete]
+            for future in as_completed(futures):
+                result = future.result()
+                done += 1
+                if result is not None:
+                    deleted.append(result)
+                # Stream progress to the button every few completions
+                if (done % 5 == 0 or done == total) and self._alive:
+                    text = f"🔄 Cleaning up... {done}/{total}"
+                    self.after(0, lambda t=text: self._set_confirm_text(t))
+        if self._alive:
+            self.after(0, lambda: self._finish(keep, deleted))
+
+    def _set_confirm_text(self, text: str) -> None:
+        """Progress callback — tolerate the window going away mid-cleanup."""
+        if not self._alive:
+            return
+        try:
+            self._confirm_btn.configure(text=text)
+        except tk.TclError:
+            pass
 
     def _finish(self, keep: list[str], delete: list[str]) -> None:
+        if not self._alive:
+            return
+        self._alive = False
+        self.hide()
         self._on_complete(keep, delete)
-        self.destroy()
 
     def _confirm_empty(self) -> None:
+        if not self._alive:
+            return
+        self._alive = False
+        self.hide()
         self._on_complete([], [])
-        self.destroy()
 
     def _on_close(self) -> None:
+        if not self._alive:
+            return
+        self._alive = False
         all_paths = [f["path"] for f in self._all_files]
+        self.hide()
         self._on_complete(all_paths, [])
-        self.destroy()
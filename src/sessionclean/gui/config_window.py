@@ -9,7 +9,7 @@ from tkinter import filedialog
 import customtkinter as ctk
 
 from sessionclean.config import AppConfig
-from sessionclean.gui.widgets import COLORS
+from sessionclean.gui.widgets import COLORS, shared_font
 from sessionclean.utils.drive_utils import is_removable_drive
 
 logger = logging.getLogger("sessionclean")
@@ -47,7 +47,7 @@ class ConfigWindow(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             self,
             text="⚙️ Settings",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=shared_font(20, "bold"),
         )
         title.pack(pady=(15, 10))
 
@@ -55,7 +55,7 @@ class ConfigWindow(ctk.CTkToplevel):
         paths_label = ctk.CTkLabel(
             self,
             text="Monitored Folders",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=shared_font(14, "bold"),
             text_color=COLORS["text_secondary"],
         )
         paths_label.pack(anchor="w", padx=20)
@@ -70,7 +70,7 @@ class ConfigWindow(ctk.CTkToplevel):
         add_btn = ctk.CTkButton(
             self,
             text="➕ Add Folder",
-            font=ctk.CTkFont(size=13),
+            font=shared_font(13),
             fg_color=COLORS["accent_blue"],
             hover_color="#2980b9",
             command=self._browse_folder,
@@ -102,79 +102,101 @@ class ConfigWindow(ctk.CTkToplevel):
         save_btn.pack(side="right")
 
     def _render_paths(self) -> None:
-        """Render the list of monitored paths."""
-        for widget in self._paths_frame.winfo_children():
-            widget.destroy()
-
-        for i, mp in enumerate(self._config.monitored_paths):
-            row = ctk.CTkFrame(self._paths_frame, fg_color=COLORS["neutral_bg"], corner_radius=6)
-            row.pack(fill="x", pady=2)
-
-            # Enable checkbox
-            enabled_var = ctk.BooleanVar(value=mp.enabled)
-            cb = ctk.CTkCheckBox(
-                row,
-                text="",
-                variable=enabled_var,
-                width=24,
-                command=lambda idx=i, var=enabled_var: self._toggle_enabled(idx, var),
-            )
-            cb.pack(side="left", padx=(8, 4))
-
-            # Path label
-            path_label = ctk.CTkLabel(
-                row,
-                text=mp.path,
-                font=ctk.CTkFont(size=12),
-                text_color=COLORS["text_primary"] if mp.enabled else COLORS["text_muted"],
-                anchor="w",
-            )
-            path_label.pack(side="left", fill="x", expand=True, padx=4)
-
-            # Removable badge
-            if mp.is_removable:
-                badge = ctk.CTkLabel(
-                    row,
-                    text="USB",
-                    font=ctk.CTkFont(size=10),
-                    text_color=COLORS["accent_blue"],
-                    fg_color="#1a3a5a",
-                    corner_radius=4,
-                    width=35,
-                    height=20,
-                )
-                badge.pack(side="right", padx=4)
-
-            # Remove button
-            remove_btn = ctk.CTkButton(
-                row,
-                text="✕",
-                width=30,
-                height=26,
-                fg_color=COLORS["danger_red"],
-                hover_color=COLORS["delete_hover"],
-                command=lambda idx=i: self._remove_path(idx),
+        """Build all path rows (full rebuild — first open only).
+
+        Subsequent changes patch single rows in place instead of
+        destroying and reconstructing the whole list; CTk widget
+        construction is the dominant cost here.
+        """
+        for row in getattr(self, "_rows", []):
+            row["frame"].destroy()
+        self._rows: list[dict] = []
+        for mp in self._config.monitored_paths:
+            self._build_row(mp)
+
+    def _build_row(self, mp) -> None:
+        """Append a single path row without touching existing rows."""
+        frame = ctk.CTkFrame(self._paths_frame, fg_color=COLORS["neutral_bg"], corner_radius=6)
+        frame.pack(fill="x", pady=2)
+
+        enabled_var = ctk.BooleanVar(value=mp.enabled)
+        row = {"frame": frame, "mp": mp, "var": enabled_var}
+
+        # Enable checkbox
+        cb = ctk.CTkCheckBox(
+            frame,
+            text="",
+            variable=enabled_var,
+            width=24,
+            command=lambda r=row: self._toggle_enabled(r),
+        )
+        cb.pack(side="left", padx=(8, 4))
+
+        # Path label
+        path_label = ctk.CTkLabel(
+            frame,
+            text=mp.path,
+            font=shared_font(12),
+            text_color=COLORS["text_primary"] if mp.enabled else COLORS["text_muted"],
+            anchor="w",
+        )
+        path_label.pack(side="left", fill="x", expand=True, padx=4)
+        row["label"] = path_label
+
+        # Removable badge
+        if mp.is_removable:
+            badge = ctk.CTkLabel(
+                frame,
+                text="USB",
+                font=shared_font(10),
+                text_color=COLORS["accent_blue"],
+                fg_color="#1a3a5a",
+                corner_radius=4,
+                width=35,
+                height=20,
             )
-            remove_btn.pack(side="right", padx=(0, 8), pady=4)
+            badge.pack(side="right", padx=4)
+
+        # Remove button
+        remove_btn = ctk.CTkButton(
+            frame,
+            text="✕",
+            width=30,
+            height=26,
+            fg_color=COLORS["danger_red"],
+            hover_color=COLORS["delete_hover"],
+            command=lambda r=row: self._remove_row(r),
+        )
+        remove_btn.pack(side="right", padx=(0, 8), pady=4)
+
+        self._rows.append(row)
 
-    def _toggle_enabled(self, index: int, var: ctk.BooleanVar) -> None:
-        """Toggle the enabled state of a monitored path."""
-        self._config.monitored_paths[index].enabled = var.get()
+    def _toggle_enabled(self, row: dict) -> None:
+        """Toggle a path's enabled state, restyling only its own label."""
+        enabled = row["var"].get()
+        row["mp"].enabled = enabled
+        row["label"].configure(
+            text_color=COLORS["text_primary"] if enabled else COLORS["text_muted"]
+        )
 
     def _browse_folder(self) -> None:
         """Open a folder browser dialog to add a new path."""
         folder = filedialog.askdirectory(title="Select folder to monitor")
         if folder:
             removable = is_removable_drive(folder)
+            before = len(self._config.monitored_paths)
             self._config.add_path(folder, recursive=True, is_removable=removable)
-            self._render_paths()
-
-    def _remove_path(self, index: int) -> None:
-        """Remove a monitored path by index."""
-        if 0 <= index < len(self._config.monitored_paths):
-            removed = self._config.monitored_paths.pop(index)
-            logger.info("Removed monitored path: %s", removed.path)
-            self._render_paths()
+            if len(self._config.monitored_paths) > before:
+                self._build_row(self._config.monitored_paths[-1])
+
+    def _remove_row(self, row: dict) -> None:
+        """Remove a monitored path, destroying only its own row."""
+        # Go through remove_path so the config's resolved-path cache
+        # stays in sync.
+        self._config.remove_path(row["mp"].path)
+        row["frame"].destroy()
+        self._rows.remove(row)
+        logger.info("Removed monitored path: %s", row["mp"].path)
 
     def _save_and_close(self) -> None:
         """Save config and close the window."""
@@ -27,6 +27,25 @@ COLORS = {
     "accent_blue": "#3498db",
 }
 
+# Shared font instances — CTkFont construction registers entries in Tk's
+# font tables, so per-row construction adds up. Built lazily because fonts
+# need a Tk root to exist.
+_font_cache: dict[tuple[int, str | None], ctk.CTkFont] = {}
+
+
+def shared_font(size: int, weight: str | None = None) -> ctk.CTkFont:
+    """Return a cached CTkFont for the given size/weight."""
+    key = (size, weight)
+    font = _font_cache.get(key)
+    if font is None:
+        if weight is not None:
+            font = ctk.CTkFont(size=size, weight=weight)
+        else:
+            font = ctk.CTkFont(size=size)
+        _font_cache[key] = font
+    return font
+
+
 # Category emoji/icons (text-based for simplicity)
 CATEGORY_ICONS: dict[str, str] = {
     "Documents": "📄",
@@ -98,13 +117,20 @@ class FileCard(ctk.CTkFrame):
         top_frame = ctk.CTkFrame(self, fg_color="transparent")
         top_frame.pack(fill="x", padx=8, pady=(6, 2))
 
-        category = get_file_category(self._file_info["path"])
-        icon = CATEGORY_ICONS.get(category, "📁")
+        # Prefer fields precomputed at ingestion; fall back for callers
+        # that pass raw records.
+        icon = self._file_info.get("_icon")
+        if icon is None:
+            category = get_file_category(self._file_info["path"])
+            icon = CATEGORY_ICONS.get(category, "📁")
+        size_str = self._file_info.get("_size_str")
+        if size_str is None:
+            size_str = format_size(self._file_info["size"])
 
         name_label = ctk.CTkLabel(
             top_frame,
             text=f"{icon}  {self._file_info['name']}",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=shared_font(13, "bold"),
             text_color=COLORS["text_primary"],
             anchor="w",
         )
@@ -112,8 +138,8 @@ class FileCard(ctk.CTkFrame):
 
         size_label = ctk.CTkLabel(
             top_frame,
-            text=format_size(self._file_info["size"]),
-            font=ctk.CTkFont(size=12),
+            text=size_str,
+            font=shared_font(12),
             text_color=COLORS["text_secondary"],
             anchor="e",
         )
@@ -126,7 +152,7 @@ class FileCard(ctk.CTkFrame):
         dir_label = ctk.CTkLabel(
             bottom_frame,
             text=self._file_info.get("directory", ""),
-            font=ctk.CTkFont(size=11),
+            font=shared_font(11),
             text_color=COLORS["text_muted"],
             anchor="w",
         )
@@ -140,7 +166,7 @@ class FileCard(ctk.CTkFrame):
                     text="🗑️ Delete",
                     width=70,
                     height=26,
-                    font=ctk.CTkFont(size=11),
+                    font=shared_font(11),
                     fg_color=COLORS["danger_red"],
                     hover_color=COLORS["delete_hover"],
                     command=self._handle_delete,
@@ -152,7 +178,7 @@ class FileCard(ctk.CTkFrame):
                     text="✅ Keep",
                     width=70,
                     height=26,
-                    font=ctk.CTkFont(size=11),
+                    font=shared_font(11),
                     fg_color=COLORS["success_green"],
                     hover_color=COLORS["keep_hover"],
                     command=self._handle_keep,
@@ -166,7 +192,7 @@ class FileCard(ctk.CTkFrame):
                     text="↩ Undo",
                     width=60,
                     height=26,
-                    font=ctk.CTkFont(size=11),
+                    font=shared_font(11),
                     fg_color=COLORS["neutral_border"],
                     hover_color=COLORS["neutral_hover"],
                     command=self._handle_delete,  # Move back to unsorted
@@ -180,7 +206,7 @@ class FileCard(ctk.CTkFrame):
                     text="↩ Undo",
                     width=60,
                     height=26,
-                    font=ctk.CTkFont(size=11),
+                    font=shared_font(11),
                     fg_color=COLORS["neutral_border"],
                     hover_color=COLORS["neutral_hover"],
                     command=self._handle_keep,  # Move back to unsorted
@@ -208,14 +234,14 @@ class EmptyStateWidget(ctk.CTkFrame):
         emoji = ctk.CTkLabel(
             self,
             text="🎉",
-            font=ctk.CTkFont(size=60),
+            font=shared_font(60),
         )
         emoji.pack(pady=(40, 10))
 
         title = ctk.CTkLabel(
             self,
             text="Your memory is clean!",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=shared_font(24, "bold"),
             text_color=COLORS["success_green"],
         )
         title.pack(pady=(0, 8))
@@ -226,7 +252,7 @@ class EmptyStateWidget(ctk.CTkFrame):
                 "No new files were created during this session.\n"
                 "Nothing to review — you're all set!"
             ),
-            font=ctk.CTkFont(size=14),
+            font=shared_font(14),
             text_color=COLORS["text_secondary"],
             justify="center",
         )
@@ -238,7 +264,7 @@ class SummaryBar(ctk.CTkFrame):
 
     def __init__(self, parent: ctk.CTkBaseClass, **kwargs) -> None:
         super().__init__(parent, fg_color="transparent", **kwargs)
-        self._labels: dict[str, ctk.CTkLabel] = {}
+        self._vars: dict[str, ctk.StringVar] = {}
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -248,20 +274,30 @@ class SummaryBar(ctk.CTkFrame):
             ("delete", "🗑️ Delete: 0", COLORS["danger_red"]),
             ("size", "💾 Free: 0 B", COLORS["text_secondary"]),
         ]:
+            var = ctk.StringVar(value=text)
             label = ctk.CTkLabel(
                 self,
-                text=text,
-                font=ctk.CTkFont(size=13, weight="bold"),
+                textvariable=var,
+                font=shared_font(13, "bold"),
                 text_color=color,
             )
             label.pack(side="left", padx=15)
-            self._labels[key] = label
+            self._vars[key] = var
 
     def update_counts(
         self, total: int, keep: int, delete: int, delete_size: int
     ) -> None:
-        """Update all summary labels."""
-        self._labels["total"].configure(text=f"📋 New: {total}")
-        self._labels["keep"].configure(text=f"✅ Keep: {keep}")
-        self._labels["delete"].configure(text=f"🗑️ Delete: {delete}")
-        self._labels["size"].configure(text=f"💾 Free: {format_size(delete_size)}")
+        """Update the summary labels, skipping unchanged values.
+
+        Variable-driven text lets Tk coalesce the updates instead of going
+        through the widget reconfigure (and canvas redraw) path.
+        """
+        for key, text in (
+            ("total", f"📋 New: {total}"),
+            ("keep", f"✅ Keep: {keep}"),
+            ("delete", f"🗑️ Delete: {delete}"),
+            ("size", f"💾 Free: {format_size(delete_size)}"),
+        ):
+            var = self._vars[key]
+            if var.get() != text:
+                var.set(text)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
 
 from watchdog.events import (
@@ -13,6 +14,7 @@ from watchdog.events import (
     FileSystemEventHandler,
 )
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 from sessionclean.config import AppConfig, MonitoredPath
 from sessionclean.database import SnapshotDatabase
@@ -29,6 +31,13 @@ class SessionFileHandler(FileSystemEventHandler):
     in the startup snapshot.
     """
 
+    # How long to coalesce burst events before flushing them as one
+    # transaction (a browser download or unzip can emit hundreds of
+    # creations in under a second), and how many events force an early
+    # flush regardless of the timer.
+    FLUSH_INTERVAL = 0.2
+    FLUSH_THRESHOLD = 100
+
     def __init__(
         self,
         db: SnapshotDatabase,
@@ -39,6 +48,19 @@ class SessionFileHandler(FileSystemEventHandler):
         self._db = db
         self._filter = filter_engine
         self._scan_start_time = scan_start_time
+        # path -> (created_at, file_type): duplicate creates/modifies for a
+        # still-growing file coalesce into one entry; its size is read at
+        # flush time so the final size is recorded once.
+        self._pending: dict[str, tuple[float, str]] = {}
+        self._pending_lock = threading.Lock()
+        # One long-lived flusher thread, woken by event: a fresh Timer
+        # thread per burst would miss the database's thread-local
+        # connection cache and rebuild a fully-pragma'd connection every
+        # 200ms flush.
+        self._flush_event = threading.Event()
+        threading.Thread(
+            target=self._flush_loop, name="EventFlusher", daemon=True
+        ).start()
 
     def on_created(self, event: FileCreatedEvent) -> None:
         """Record a newly created file if it passes filters."""
@@ -50,7 +72,9 @@ class SessionFileHandler(FileSystemEventHandler):
         """Track file if moved into a monitored directory."""
         if event.is_directory:
             return
-        # Remove old path if tracked
+        # Drop any coalescing entry for the old path before removing it
+        with self._pending_lock:
+            self._pending.pop(event.src_path, None)
         self._db.remove_new_file(event.src_path)
         # Record new path
         self._try_record(event.dest_path)
@@ -59,28 +83,64 @@ class SessionFileHandler(FileSystemEventHandler):
         """Remove from new_files if a tracked file is deleted during the session."""
         if event.is_directory:
             return
+        with self._pending_lock:
+            self._pending.pop(event.src_path, None)
         self._db.remove_new_file(event.src_path)
 
     def _try_record(self, file_path: str) -> None:
-        """Check filters and snapshot, then record if appropriate."""
+        """Check filters, then coalesce into the next batch flush."""
         if not self._filter.should_include(file_path):
             return
 
-        # Don't record files that existed at startup
-        if self._db.is_in_snapshot(file_path):
+        flush_now = False
+        with self._pending_lock:
+            # Re-created paths keep their first-seen timestamp
+            if file_path not in self._pending:
+                self._pending[file_path] = (
+                    time.time(), get_file_type(file_path),
+                )
+            if len(self._pending) >= self.FLUSH_THRESHOLD:
+                flush_now = True
+        if flush_now:
+            self._flush_pending()
+        else:
+            self._flush_event.set()
+
+    def _flush_loop(self) -> None:
+        """Long-lived flusher: wake on the first event of a burst, give the
+        burst its coalescing window, then flush on this one thread (whose
+        database connection persists across flushes)."""
+        while True:
+            self._flush_event.wait()
+            time.sleep(self.FLUSH_INTERVAL)
+            self._flush_event.clear()
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write all coalesced events as a single transaction."""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {}
+        if not pending:
             return
 
-        try:
-            size = os.path.getsize(file_path)
-            file_type = get_file_type(file_path)
-            self._db.record_new_file(
-                path=file_path,
-                size=size,
-                created_at=time.time(),
-                file_type=file_type,
-            )
-        except (OSError, PermissionError) as exc:
-            logger.debug("Could not record %s: %s", file_path, exc)
+        # Snapshot membership is checked once per batch instead of per
+        # event — files that existed at startup are dropped here.
+        in_snapshot = self._db.is_in_snapshot_many(pending)
+        rows = []
+        for path, (created_at, file_type) in pending.items():
+            if path in in_snapshot:
+                continue
+            try:
+                # Size read at flush time: the file has had the debounce
+                # window to finish growing.
+                size = os.path.getsize(path)
+            except (OSError, PermissionError) as exc:
+                logger.debug("Could not record %s: %s", path, exc)
+                continue
+            rows.append((path, size, created_at, file_type))
+        if rows:
+            self._db.record_new_files_batch(rows)
 
 
 class FileMonitor:
@@ -98,6 +158,15 @@ class FileMonitor:
         self._filter = filter_engine
         self._scan_start_time = scan_start_time
         self._observers: dict[str, Observer] = {}
+        self._stop_event = threading.Event()
+        # One handler serves every observer — nothing in it is
+        # root-specific, and its pending buffer is lock-protected against
+        # concurrent observer threads.
+        self._handler = SessionFileHandler(
+            db=db,
+            filter_engine=filter_engine,
+            scan_start_time=scan_start_time,
+        )
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -110,9 +179,17 @@ class FileMonitor:
         for mp in active_paths:
             self._start_observer(mp)
 
+        # Watch for offline drives coming back and resume monitoring them.
+        threading.Thread(
+            target=self._probe_offline_paths,
+            name="DriveProber",
+            daemon=True,
+        ).start()
+
     def stop(self) -> None:
         """Stop all observers gracefully."""
         logger.info("Stopping all file monitors")
+        self._stop_event.set()
         for path, observer in self._observers.items():
             try:
                 observer.stop()
@@ -120,6 +197,8 @@ class FileMonitor:
                 logger.debug("Stopped observer for %s", path)
             except Exception as exc:
                 logger.warning("Error stopping observer for %s: %s", path, exc)
+        # Flush any events still coalescing so they aren't lost
+        self._handler._flush_pending()
         self._observers.clear()
 
     # ------------------------------------------------------------------
@@ -127,18 +206,32 @@ class FileMonitor:
     # ------------------------------------------------------------------
     def _start_observer(self, mp: MonitoredPath) -> None:
         """Start a single observer for a monitored path."""
+        # The prober can race stop(): never schedule a new observer after
+        # the monitor was told to shut down, or it would keep recording
+        # with nothing left to stop it.
+        if self._stop_event.is_set():
+            return
+
         if mp.path in self._observers:
             logger.debug("Observer already running for %s", mp.path)
             return
 
+        # Fail fast on unreachable paths — watchdog can hang or error
+        # slowly on offline drives; the prober resumes them when back.
+        if not os.path.exists(mp.path):
+            logger.info("Path unavailable, skipping: %s", mp.path)
+            return
+
         try:
-            handler = SessionFileHandler(
-                db=self._db,
-                filter_engine=self._filter,
-                scan_start_time=self._scan_start_time,
-            )
-            observer = Observer()
-            observer.schedule(handler, mp.path, recursive=mp.recursive)
+            # Removable media (FAT32 sticks, network mounts) don't deliver
+            # reliable change notifications through the native backend;
+            # poll those at a bounded interval and keep the kernel-driven
+            # observer for fixed drives.
+            if mp.is_removable:
+                observer = PollingObserver(timeout=2.0)
+            else:
+                observer = Observer()
+            observer.schedule(self._handler, mp.path, recursive=mp.recursive)
             observer.daemon = True
             observer.start()
             self._observers[mp.path] = observer
@@ -148,6 +241,8 @@ class FileMonitor:
 
     def restart_observer(self, path: str) -> None:
         """Restart a single observer (e.g., when a drive reconnects)."""
+        if self._stop_event.is_set():
+            return
         if path in self._observers:
             try:
                 self._observers[path].stop()
@@ -155,12 +250,27 @@ class FileMonitor:
             except Exception:
                 pass
             del self._observers[path]
+            # Drain anything still coalescing from the stopped observer.
+            self._handler._flush_pending()
 
         for mp in self._config.get_active_paths():
             if mp.path == path:
                 self._start_observer(mp)
                 break
 
+    def _probe_offline_paths(self) -> None:
+        """Periodically probe unmonitored-but-enabled paths; resume any
+        that became reachable (e.g. a USB drive plugged back in)."""
+        while not self._stop_event.wait(5.0):
+            for mp in self._config.monitored_paths:
+                if (
+                    mp.enabled
+                    and mp.path not in self._observers
+                    and os.path.exists(mp.path)
+                ):
+                    logger.info("Path became available: %s", mp.path)
+                    self.restart_observer(mp.path)
+
     @property
     def active_paths(self) -> list[str]:
         """Return the list of currently monitored paths."""
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
-from pathlib import Path
+from array import array
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from stat import S_ISDIR, S_ISREG
 
-from sessionclean.config import AppConfig
+from sessionclean.config import AppConfig, MonitoredPath
 from sessionclean.constants import SCANNER_BATCH_SIZE
 from sessionclean.database import SnapshotDatabase
 from sessionclean.filter_engine import FilterEngine
@@ -34,6 +39,12 @@ class Scanner:
         self._scan_start_time: float = 0.0
         self._is_scanning: bool = False
         self._total_files: int = 0
+        self._progress_count: int = 0
+        self._progress_lock = threading.Lock()
+        self._on_progress: Callable[[int], None] | None = None
+        # Pool workers are non-daemon and joined at interpreter exit, so a
+        # mid-walk shutdown needs a cooperative way to drain them.
+        self._cancel_event = threading.Event()
 
     # ------------------------------------------------------------------
     # Public API
@@ -51,33 +62,59 @@ class Scanner:
     def total_files(self) -> int:
         return self._total_files
 
-    def take_snapshot(self) -> int:
+    def cancel(self) -> None:
+        """Ask an in-flight snapshot to stop; workers drain at the next
+        directory boundary so process exit isn't held for the full walk."""
+        self._cancel_event.set()
+
+    def take_snapshot(
+        self, on_progress: Callable[[int], None] | None = None
+    ) -> int:
         """Scan all monitored paths and store the snapshot.
 
         Returns the total number of files recorded.
         Skips paths that are unavailable (e.g., disconnected drives).
+        When given, on_progress receives the cumulative file count after
+        each stored batch (called from scan worker threads).
         """
         self._scan_start_time = time.time()
         self._is_scanning = True
         self._total_files = 0
+        self._progress_count = 0
+        self._on_progress = on_progress
+        self._cancel_event.clear()
 
-        active_paths = self._config.get_active_paths()
+        active_paths = self._coalesce_roots(self._config.get_active_paths())
         logger.info(
             "Starting snapshot scan of %d paths: %s",
             len(active_paths),
             [mp.path for mp in active_paths],
         )
 
-        for monitored_path in active_paths:
-            try:
-                count = self._scan_directory(
-                    root=Path(monitored_path.path),
-                    recursive=monitored_path.recursive,
-                )
-                self._total_files += count
-                logger.info("Scanned %s: %d files", monitored_path.path, count)
-            except (OSError, PermissionError) as exc:
-                logger.warning("Failed to scan %s: %s", monitored_path.path, exc)
+        # One worker per root (bounded): separate drives overlap their I/O
+        # latencies instead of being walked serially. The database layer is
+        # already thread-safe (per-thread connections + write lock).
+        if active_paths:
+            max_workers = min(4, len(active_paths))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="ScanWorker"
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        self._scan_directory,
+                        root=mp.path,
+                        recursive=mp.recursive,
+                    ): mp
+                    for mp in active_paths
+                }
+                for future in as_completed(futures):
+                    mp = futures[future]
+                    try:
+                        count = future.result()
+                        self._total_files += count
+                        logger.info("Scanned %s: %d files", mp.path, count)
+                    except (OSError, PermissionError) as exc:
+                        logger.warning("Failed to scan %s: %s", mp.path, exc)
 
         self._is_scanning = False
         logger.info("Snapshot complete. Total files: %d", self._total_files)
@@ -86,46 +123,142 @@ class Scanner:
     # ------------------------------------------------------------------
     # Private
     # ------------------------------------------------------------------
-    def _scan_directory(self, root: Path, recursive: bool) -> int:
+    @staticmethod
+    def _coalesce_roots(paths: list[MonitoredPath]) -> list[MonitoredPath]:
+        """Drop duplicate roots and roots nested under a recursive parent.
+
+        Overlapping configs (e.g. Documents inside the user home) would
+        otherwise walk the same subtree once per root.
+        """
+        selected: list[tuple[str, MonitoredPath]] = []
+        for mp in sorted(
+            paths, key=lambda m: os.path.normcase(os.path.normpath(m.path))
+        ):
+            norm = os.path.normcase(os.path.normpath(mp.path))
+            covered = any(
+                norm == parent_norm
+                or (
+                    parent.recursive
+                    # normpath keeps the trailing separator on drive roots
+                    # ("D:\\", "/"), so strip before re-adding it or the
+                    # prefix test never matches children of a root.
+                    and norm.startswith(parent_norm.rstrip(os.sep) + os.sep)
+                )
+                for parent_norm, parent in selected
+            )
+            if covered:
+                logger.info(
+                    "Skipping %s — already covered by another monitored root",
+                    mp.path,
+                )
+                continue
+            selected.append((norm, mp))
+        return [mp for _, mp in selected]
+
+    def _scan_directory(self, root: str, recursive: bool) -> int:
         """Walk a single directory tree, storing batches to the database.
 
         Uses os.scandir() for performance (faster than os.walk or Path.iterdir).
+        Paths stay plain strings throughout the walk — Path construction per
+        directory is measurable overhead on large trees.
         """
+        # Cheap reachability check before walking — opening a scandir on a
+        # dead mapped/network drive can block for a long timeout, while
+        # isdir fails fast.
+        if not os.path.isdir(root):
+            logger.debug("Root not reachable, skipping: %s", root)
+            return 0
+
         count = 0
-        batch: list[tuple[str, float, int]] = []
+        # SoA batch buffers: compact typed arrays for the numeric columns
+        # instead of one 3-tuple allocation per file.
+        paths: list[str] = []
+        mtimes = array("d")
+        sizes = array("q")
 
         for file_path, mtime, size in self._iter_files(root, recursive):
-            batch.append((file_path, mtime, size))
+            paths.append(file_path)
+            mtimes.append(mtime)
+            sizes.append(size)
             count += 1
 
-            if len(batch) >= SCANNER_BATCH_SIZE:
-                self._db.store_snapshot_batch(batch)
-                batch.clear()
+            if len(paths) >= SCANNER_BATCH_SIZE:
+                self._db.store_snapshot_batch_columns(paths, mtimes, sizes)
+                self._report_progress(len(paths))
+                paths = []
+                mtimes = array("d")
+                sizes = array("q")
 
         # Flush remaining
-        if batch:
-            self._db.store_snapshot_batch(batch)
+        if paths:
+            self._db.store_snapshot_batch_columns(paths, mtimes, sizes)
+            self._report_progress(len(paths))
 
         return count
 
-    def _iter_files(self, root: Path, recursive: bool):
-        """Yield (path, mtime, size) for all files under root."""
+    def _report_progress(self, batch_count: int) -> None:
+        """Push the cumulative scanned count to the progress callback."""
+        if self._on_progress is None:
+            return
+        with self._progress_lock:
+            self._progress_count += batch_count
+            total = self._progress_count
         try:
-            with os.scandir(root) as entries:
-                for entry in entries:
-                    try:
-                        if entry.is_file(follow_symlinks=False):
+            self._on_progress(total)
+        except Exception as exc:
+            logger.debug("Progress callback failed: %s", exc)
+
+    def _iter_files(self, root: str, recursive: bool):
+        """Yield (path, mtime, size) for all files under root.
+
+        Iterative walk over an explicit stack — no per-directory generator
+        frames or recursion depth concerns on deep trees.
+
+        Invariant: every entry.stat() call passes follow_symlinks=False.
+        That's what lets Windows serve the result from the directory
+        enumeration (FindFirstFileExW large-fetch) without issuing a
+        per-file GetFileAttributesExW; following links would force one.
+        """
+        # Pre-bind the per-entry lookups — LOAD_GLOBAL/LOAD_ATTR in the
+        # inner loop costs real time at hundreds of thousands of entries.
+        ignored = self._filter._ignored_directories
+        should_include = self._filter.should_include
+        scandir = os.scandir
+        is_reg = S_ISREG
+        is_dir = S_ISDIR
+        cancelled = self._cancel_event.is_set
+        stack = deque([root])
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            if cancelled():
+                logger.info("Scan cancelled while walking %s", root)
+                return
+            directory = pop()
+            try:
+                with scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            # One stat per entry — DirEntry caches it from
+                            # the directory read on Windows, and file-ness
+                            # falls out of the mode bits without a second
+                            # is_file/is_dir probe.
                             stat_result = entry.stat(follow_symlinks=False)
-                            yield (
-                                entry.path,
-                                stat_result.st_mtime,
-                                stat_result.st_size,
-                            )
-                        elif recursive and entry.is_dir(follow_symlinks=False):
-                            # Skip directories we know are junk
-                            if entry.name.lower() not in self._filter._ignored_directories:
-                                yield from self._iter_files(Path(entry.path), recursive)
-                    except (PermissionError, OSError):
-                        continue
-        except (PermissionError, OSError) as exc:
-            logger.debug("Cannot scan %s: %s", root, exc)
+                            mode = stat_result.st_mode
+                            if is_reg(mode):
+                                # Filter here with the cached stat — junk
+                                # files never reach the database at all.
+                                if should_include(entry.path, stat_result):
+                                    yield (
+                                        entry.path,
+                                        stat_result.st_mtime,
+                                        stat_result.st_size,
+                                    )
+                            elif recursive and is_dir(mode):
+                                # Skip directories we know are junk
+                                if entry.name.lower() not in ignored:
+                                    push(entry.path)
+                        except (PermissionError, OSError):
+                            continue
+            except (PermissionError, OSError) as exc:
+                logger.debug("Cannot scan %s: %s", directory, exc)
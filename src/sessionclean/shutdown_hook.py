@@ -11,24 +11,73 @@ import ctypes.wintypes as wintypes
 import logging
 import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from sessionclean.constants import APP_DIR, INTERRUPTED_FLAG
 
 logger = logging.getLogger("sessionclean")
 
 # Windows constants
 WM_QUERYENDSESSION = 0x0011
-WM_ENDSESSION = 0x0012
+WM_ENDSESSION = 0x0016  # (0x0012 is WM_QUIT — the old value was wrong)
 WM_CLOSE = 0x0010
 WM_DESTROY = 0x0002
+WM_QUIT = 0x0012
 WM_USER_SHOW_REVIEW = 0x0400 + 1  # Custom message to trigger review
 
+# Message-pump constants
+PM_REMOVE = 0x0001
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+INFINITE = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0
+
+# LRESULT is pointer-sized (ctypes.wintypes doesn't define it); using
+# c_long would truncate/sign-extend returns on 64-bit Windows.
+LRESULT = ctypes.c_ssize_t
+
 WNDPROC = ctypes.WINFUNCTYPE(
-    ctypes.c_long,
+    LRESULT,
     wintypes.HWND,
     ctypes.c_uint,
     wintypes.WPARAM,
     wintypes.LPARAM,
 )
 
+# Pre-bound function pointers with explicit signatures. The wndproc runs on
+# every dispatched message; declaring argtypes up front skips ctypes'
+# per-call argument inference and the windll attribute-cache walk.
+_user32 = ctypes.windll.user32
+_kernel32 = ctypes.windll.kernel32
+
+_DefWindowProcW = _user32.DefWindowProcW
+_DefWindowProcW.argtypes = [wintypes.HWND, ctypes.c_uint, wintypes.WPARAM, wintypes.LPARAM]
+_DefWindowProcW.restype = LRESULT
+
+_PostMessageW = _user32.PostMessageW
+_PostMessageW.argtypes = [wintypes.HWND, ctypes.c_uint, wintypes.WPARAM, wintypes.LPARAM]
+_PostMessageW.restype = wintypes.BOOL
+
+_SendNotifyMessageW = _user32.SendNotifyMessageW
+_SendNotifyMessageW.argtypes = [wintypes.HWND, ctypes.c_uint, wintypes.WPARAM, wintypes.LPARAM]
+_SendNotifyMessageW.restype = wintypes.BOOL
+
+_PostQuitMessage = _user32.PostQuitMessage
+_PostQuitMessage.argtypes = [ctypes.c_int]
+_PostQuitMessage.restype = None
+
+_ShutdownBlockReasonCreate = _user32.ShutdownBlockReasonCreate
+_ShutdownBlockReasonCreate.argtypes = [wintypes.HWND, wintypes.LPCWSTR]
+_ShutdownBlockReasonCreate.restype = wintypes.BOOL
+
+_ShutdownBlockReasonDestroy = _user32.ShutdownBlockReasonDestroy
+_ShutdownBlockReasonDestroy.argtypes = [wintypes.HWND]
+_ShutdownBlockReasonDestroy.restype = wintypes.BOOL
+
+_SetEvent = _kernel32.SetEvent
+_SetEvent.argtypes = [wintypes.HANDLE]
+_SetEvent.restype = wintypes.BOOL
+
 
 class ShutdownHook:
     """Creates a hidden window to intercept Windows shutdown events.
@@ -58,6 +107,13 @@ class ShutdownHook:
         self._hwnd: int | None = None
         self._shutdown_blocked = False
         self._ready_event = threading.Event()
+        self._stop_handle: int | None = None  # Win32 event that wakes the pump
+        # One reused worker for the UI-trigger callbacks — spawning a fresh
+        # thread per WM_QUERYENDSESSION / review message pays a stack plus
+        # thread-create each time when the user repeats the action.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ShutdownCallback"
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -83,29 +139,44 @@ class ShutdownHook:
         """Remove the shutdown block and allow Windows to proceed."""
         if self._hwnd and self._shutdown_blocked:
             try:
-                ctypes.windll.user32.ShutdownBlockReasonDestroy(self._hwnd)
+                _ShutdownBlockReasonDestroy(self._hwnd)
                 self._shutdown_blocked = False
                 logger.info("Shutdown block removed. Windows may proceed.")
             except Exception as exc:
                 logger.error("Failed to remove shutdown block: %s", exc)
 
     def request_review(self) -> None:
-        """Send a custom message to trigger the review UI (e.g., from tray menu)."""
+        """Send a custom message to trigger the review UI (e.g., from tray menu).
+
+        SendNotifyMessage rather than PostMessage: posted messages can be
+        silently dropped when the queue is saturated, and this is a
+        user-triggered one-shot where delivery matters. It does not block
+        the caller for windows on another thread.
+        """
         if self._hwnd:
-            ctypes.windll.user32.PostMessageW(
-                self._hwnd, WM_USER_SHOW_REVIEW, 0, 0
-            )
+            _SendNotifyMessageW(self._hwnd, WM_USER_SHOW_REVIEW, 0, 0)
 
     def stop(self) -> None:
-        """Post WM_CLOSE to gracefully exit the message loop."""
+        """Close the window and wake the message loop to exit."""
         if self._hwnd:
-            ctypes.windll.user32.PostMessageW(self._hwnd, WM_CLOSE, 0, 0)
+            _PostMessageW(self._hwnd, WM_CLOSE, 0, 0)
+        if self._stop_handle:
+            # Guaranteed wake even if the message queue is saturated
+            _SetEvent(self._stop_handle)
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     # ------------------------------------------------------------------
     # Win32 internals
     # ------------------------------------------------------------------
     def _register_and_create(self) -> None:
         """Register the window class and create the hidden window."""
+        # Ensure the app dir now, so the forced-shutdown emergency save
+        # doesn't need a mkdir while the OS tears the process down.
+        try:
+            APP_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
+
         user32 = ctypes.windll.user32
         kernel32 = ctypes.windll.kernel32
 
@@ -153,15 +224,11 @@ class ShutdownHook:
         lparam: int,
     ) -> int:
         """Window procedure handling shutdown and custom messages."""
-        user32 = ctypes.windll.user32
-
         if msg == WM_QUERYENDSESSION:
             logger.info("WM_QUERYENDSESSION received — blocking shutdown")
             self._block_shutdown(hwnd)
-            # Trigger the cleanup UI on a separate thread to avoid blocking wndproc
-            threading.Thread(
-                target=self._safe_callback, daemon=True
-            ).start()
+            # Trigger the cleanup UI off-thread to avoid blocking wndproc
+            self._executor.submit(self._safe_callback)
             return 0  # Block shutdown
 
         elif msg == WM_ENDSESSION:
@@ -172,24 +239,20 @@ class ShutdownHook:
 
         elif msg == WM_USER_SHOW_REVIEW:
             logger.info("Manual review requested via custom message")
-            threading.Thread(
-                target=self._safe_review_callback, daemon=True
-            ).start()
+            self._executor.submit(self._safe_review_callback)
             return 0
 
         elif msg == WM_DESTROY:
-            user32.PostQuitMessage(0)
+            _PostQuitMessage(0)
             return 0
 
-        return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+        return _DefWindowProcW(hwnd, msg, wparam, lparam)
 
     def _block_shutdown(self, hwnd: int) -> None:
         """Call ShutdownBlockReasonCreate to show reason in Windows UI."""
         try:
             reason = "SessionClean is reviewing your new files..."
-            ctypes.windll.user32.ShutdownBlockReasonCreate(
-                hwnd, reason
-            )
+            _ShutdownBlockReasonCreate(hwnd, reason)
             self._shutdown_blocked = True
             logger.info("Shutdown blocked: %s", reason)
         except Exception as exc:
@@ -212,24 +275,66 @@ class ShutdownHook:
             logger.error("Review callback error: %s", exc)
 
     def _emergency_save(self) -> None:
-        """Minimal save if the user forces shutdown."""
-        from sessionclean.constants import APP_DIR, INTERRUPTED_FLAG
+        """Minimal save if the user forces shutdown.
 
+        The app dir is ensured at window creation, so this is a single
+        open/write/close on the path the OS is about to tear down.
+        """
         try:
-            APP_DIR.mkdir(parents=True, exist_ok=True)
             INTERRUPTED_FLAG.write_text("interrupted", encoding="utf-8")
             logger.info("Emergency flag written: %s", INTERRUPTED_FLAG)
         except Exception as exc:
             logger.error("Emergency save failed: %s", exc)
 
     def _pump_messages(self) -> None:
-        """Standard Win32 message pump."""
+        """Event-wakeable Win32 message pump.
+
+        Blocks on MsgWaitForMultipleObjectsEx so stop() can wake the loop
+        through a kernel event even when no window message arrives, then
+        drains every queued message before re-blocking. CPU stays at zero
+        while idle.
+        """
         user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
         msg = wintypes.MSG()
+        msg_ref = ctypes.byref(msg)
 
-        while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
-            user32.TranslateMessage(ctypes.byref(msg))
-            user32.DispatchMessageW(ctypes.byref(msg))
+        # Bind the per-iteration calls once — each windll attribute access
+        # walks the function-pointer cache, which matters inside the drain.
+        wait_for = user32.MsgWaitForMultipleObjectsEx
+        peek = user32.PeekMessageW
+        translate = user32.TranslateMessage
+        dispatch = user32.DispatchMessageW
+
+        self._stop_handle = kernel32.CreateEventW(None, False, False, None)
+        handles = (wintypes.HANDLE * 1)(self._stop_handle)
+
+        try:
+            while True:
+                result = wait_for(
+                    1, handles, INFINITE, QS_ALLINPUT, MWMO_INPUTAVAILABLE
+                )
+                if result == WAIT_OBJECT_0:
+                    break  # stop() signaled the event
+                if result < 0 or result == 0xFFFFFFFF:
+                    # WAIT_FAILED (bad handle) — bail out rather than spin
+                    logger.error(
+                        "Message wait failed: %s", ctypes.GetLastError()
+                    )
+                    break
+
+                quitting = False
+                while peek(msg_ref, 0, 0, 0, PM_REMOVE):
+                    if msg.message == WM_QUIT:
+                        quitting = True
+                        break
+                    translate(msg_ref)
+                    dispatch(msg_ref)
+                if quitting:
+                    break
+        finally:
+            kernel32.CloseHandle(self._stop_handle)
+            self._stop_handle = None
 
         logger.info("Shutdown hook message loop exited")
 
@@ -71,6 +71,8 @@ class TrayIcon:
     # ------------------------------------------------------------------
     def update_status(self, new_files_count: int) -> None:
         """Update the tooltip and menu with the current file count."""
+        if new_files_count == self._new_files_count:
+            return
         self._new_files_count = new_files_count
 
         if new_files_count == 0:
@@ -80,17 +82,33 @@ class TrayIcon:
 
         if self._icon:
             self._icon.title = self._status_text
-            # Rebuild menu to update the count display
-            self._icon.menu = self._build_menu()
+            # Menu items are callables that read the current count when the
+            # menu opens; just invalidate instead of rebuilding.
+            self._icon.update_menu()
+
+    def update_scan_progress(self, scanned_count: int) -> None:
+        """Show startup-scan progress in the tooltip (no menu rebuild)."""
+        if self._icon:
+            self._icon.title = f"SessionClean — Scanning... {scanned_count:,} files"
+
+    def scan_finished(self) -> None:
+        """Restore the regular status tooltip once the scan completes.
+
+        Needed explicitly because update_status short-circuits unchanged
+        counts — a session with zero new files would otherwise keep the
+        'Scanning...' tooltip forever.
+        """
+        if self._icon:
+            self._icon.title = self._status_text
 
     # ------------------------------------------------------------------
     # Menu
     # ------------------------------------------------------------------
     def _build_menu(self) -> pystray.Menu:
-        """Build the context menu."""
+        """Build the context menu (once — dynamic entries are callables)."""
         return pystray.Menu(
             pystray.MenuItem(
-                f"New files: {self._new_files_count}",
+                lambda item: f"New files: {self._new_files_count}",
                 action=None,
                 enabled=False,
             ),
@@ -98,7 +116,7 @@ class TrayIcon:
             pystray.MenuItem(
                 "Review Files Now",
                 action=lambda icon, item: self._on_review_now(),
-                enabled=self._new_files_count > 0,
+                enabled=lambda item: self._new_files_count > 0,
             ),
             pystray.MenuItem(
                 "Settings...",
@@ -114,16 +132,27 @@ class TrayIcon:
     # ------------------------------------------------------------------
     # Icon
     # ------------------------------------------------------------------
+    # Decoded icon cached at class level — settings-driven tray restarts
+    # shouldn't re-decode the PNG (or re-rasterize the fallback).
+    _icon_cache: Image.Image | None = None
+
     def _load_icon(self) -> Image.Image:
         """Load the app icon, or generate a simple one if not found."""
+        if TrayIcon._icon_cache is not None:
+            return TrayIcon._icon_cache
+
+        icon = None
         icon_path = ASSETS_DIR / "icon.png"
         if icon_path.exists():
             try:
-                return Image.open(icon_path).resize((ICON_SIZE, ICON_SIZE))
+                icon = Image.open(icon_path).resize((ICON_SIZE, ICON_SIZE))
             except Exception as exc:
                 logger.warning("Failed to load icon: %s. Using generated icon.", exc)
+        if icon is None:
+            icon = self._generate_icon()
 
-        return self._generate_icon()
+        TrayIcon._icon_cache = icon
+        return icon
 
     @staticmethod
     def _generate_icon() -> Image.Image:
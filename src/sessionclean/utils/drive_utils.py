@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import ctypes
+import functools
 import logging
 import os
 from pathlib import Path
 
 logger = logging.getLogger("sessionclean")
 
+# Win32 drive types (GetDriveTypeW)
+DRIVE_REMOVABLE = 2
+DRIVE_CDROM = 5
+
 
 def is_drive_available(path: str) -> bool:
     """Check if a drive or path is currently accessible."""
@@ -17,20 +23,56 @@ def is_drive_available(path: str) -> bool:
         return False
 
 
-def get_drive_letter(path: str) -> str | None:
-    """Extract the drive letter from a Windows path (e.g., 'C' from 'C:\\Users')."""
+@functools.lru_cache(maxsize=1024)
+def _resolve_drive_letter(path: str) -> str | None:
+    """Resolve-based fallback for paths without an explicit drive prefix."""
     resolved = str(Path(path).resolve())
     if len(resolved) >= 2 and resolved[1] == ":":
         return resolved[0].upper()
     return None
 
 
+def get_drive_letter(path: str) -> str | None:
+    """Extract the drive letter from a Windows path (e.g., 'C' from 'C:\\Users').
+
+    Absolute paths are answered by pure string inspection; resolve() (a
+    filesystem walk) runs only for relative/UNC inputs, memoized.
+    """
+    if len(path) >= 2 and path[1] == ":":
+        return path[0].upper()
+    return _resolve_drive_letter(path)
+
+
+@functools.lru_cache(maxsize=32)
+def _is_removable_by_prefix(drive_prefix: str) -> bool:
+    """Cached removability verdict for a drive prefix like 'C:'.
+
+    Asks Windows directly via GetDriveTypeW where available — a real
+    answer instead of the "not C:" heuristic. The verdict is per drive,
+    so repeated adds under the same drive skip everything.
+    """
+    try:
+        drive_type = ctypes.windll.kernel32.GetDriveTypeW(drive_prefix + "\\")
+    except AttributeError:
+        # Not on Windows — keep the heuristic
+        letter = get_drive_letter(drive_prefix + "\\")
+        if letter is None:
+            return False
+        return letter not in ("C",)
+    return drive_type in (DRIVE_REMOVABLE, DRIVE_CDROM)
+
+
 def is_removable_drive(path: str) -> bool:
-    """Heuristic check: a drive is likely removable if it's not C:\\.
+    """Check whether the path's drive is removable media.
 
-    For a more accurate check, we could use ctypes + GetDriveTypeW,
-    but this simple heuristic works for the MVP.
+    Drive-prefixed paths are answered by GetDriveTypeW (cached per
+    drive); off Windows, and for prefix-less relative paths, the old
+    "not C:\\" heuristic remains as the fallback.
     """
+    drive_prefix = os.path.splitdrive(path)[0]
+    if drive_prefix:
+        return _is_removable_by_prefix(drive_prefix.upper())
+    # No drive prefix (relative path) — resolve the full path once
     letter = get_drive_letter(path)
     if letter is None:
         return False
@@ -38,10 +80,19 @@ def is_removable_drive(path: str) -> bool:
 
 
 def get_available_drives() -> list[str]:
-    """Return a list of currently available drive letters on Windows."""
-    drives = []
-    for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-        drive_path = f"{letter}:\\"
-        if os.path.exists(drive_path):
-            drives.append(letter)
-    return drives
+    """Return a list of currently available drive letters on Windows.
+
+    One GetLogicalDrives syscall returns the whole bitmask — the old
+    26x os.path.exists probe could block for seconds on a stalled
+    removable or network drive.
+    """
+    try:
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+    except AttributeError:
+        # Not on Windows — fall back to probing
+        return [
+            letter
+            for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+            if os.path.exists(f"{letter}:\\")
+        ]
+    return [chr(ord("A") + i) for i in range(26) if mask & (1 << i)]
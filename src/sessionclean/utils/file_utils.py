@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import functools
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
 
+
+@functools.lru_cache(maxsize=8192)
 def format_size(size_bytes: int) -> str:
     """Format a byte count into a human-readable string.
 
@@ -18,24 +21,33 @@ def format_size(size_bytes: int) -> str:
     if size_bytes < 0:
         return "0 B"
 
-    units = [("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)]
-    for unit, threshold in units:
-        if size_bytes >= threshold:
-            value = size_bytes / threshold
-            return f"{value:.1f} {unit}"
-    return f"{size_bytes} B"
+    # Unit index straight from the bit length (1024^n boundaries are
+    # 10-bit steps) — no per-call threshold scan.
+    index = (size_bytes.bit_length() - 1) // 10
+    if index <= 0:
+        return f"{size_bytes} B"
+    if index > 3:
+        index = 3
+    value = size_bytes / (1 << (index * 10))
+    return f"{value:.1f} {_SIZE_UNITS[index]}"
 
 
 def get_file_type(file_path: str) -> str:
     """Return a simple file type string based on extension.
 
+    Pure string parsing — constructing a PurePath per call dominates this
+    function on scan-sized workloads.
+
     Examples:
         get_file_type("report.pdf") -> "pdf"
         get_file_type("image.PNG")  -> "png"
         get_file_type("noext")      -> ""
     """
-    ext = Path(file_path).suffix.lower()
-    return ext.lstrip(".") if ext else ""
+    name = file_path.replace("\\", "/").rsplit("/", 1)[-1]
+    dot = name.rfind(".")
+    if dot <= 0:  # no extension, or a dotfile
+        return ""
+    return name[dot + 1:].lower()
 
 
 # Category mapping for display grouping
@@ -50,15 +62,18 @@ FILE_CATEGORIES: dict[str, set[str]] = {
 }
 
 
+# Reverse lookup built once at import — category resolution is a single
+# dict index instead of a scan over every category set.
+_EXT_TO_CATEGORY: dict[str, str] = {
+    ext: category
+    for category, extensions in FILE_CATEGORIES.items()
+    for ext in extensions
+}
+
+
 def get_file_category(file_path: str) -> str:
     """Return the category of a file based on its extension.
 
     Returns "Other" if no category matches.
     """
-    ext = get_file_type(file_path)
-    if not ext:
-        return "Other"
-    for category, extensions in FILE_CATEGORIES.items():
-        if ext in extensions:
-            return category
-    return "Other"
+    return _EXT_TO_CATEGORY.get(get_file_type(file_path), "Other")
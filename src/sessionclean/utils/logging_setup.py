@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from logging.handlers import RotatingFileHandler
 
 from sessionclean.constants import APP_DIR, LOG_PATH
 
@@ -16,18 +17,36 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
 
     logger = logging.getLogger("sessionclean")
     logger.setLevel(level)
+    # Skip the root-logger handler walk on every emit
+    logger.propagate = False
 
     # Avoid adding handlers multiple times
     if logger.handlers:
         return logger
 
+    # %(funcName)s forced a sys._getframe stack walk per record (and
+    # logging still does the caller lookup whenever _srcfile is set), so
+    # the format drops it and the introspection knobs go off — this
+    # matters at one log line per processed file.
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s.%(funcName)s | %(message)s",
+        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    # File handler (rotating would be nice later, simple for MVP)
-    file_handler = logging.FileHandler(LOG_PATH, encoding="utf-8")
+    # Rotating file handler; delay=True defers the file open until the
+    # first emit (faster startup, no zero-byte file on early exit).
+    file_handler = RotatingFileHandler(
+        LOG_PATH,
+        maxBytes=2_000_000,
+        backupCount=3,
+        encoding="utf-8",
+        delay=True,
+    )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
@@ -1,6 +1,6 @@
 """Shared pytest fixtures for SessionClean tests."""
 
-import tempfile
+import shutil
 from pathlib import Path
 
 import pytest
@@ -24,22 +24,33 @@ def sample_config(tmp_dir: Path) -> AppConfig:
     )
 
 
-@pytest.fixture
-def populated_dir(tmp_dir: Path) -> Path:
-    """Create a temp directory with sample files for testing."""
+@pytest.fixture(scope="session")
+def _populated_template(tmp_path_factory) -> Path:
+    """Sample file tree built once per session."""
+    template = tmp_path_factory.mktemp("populated_template")
+
     # User-like files
-    (tmp_dir / "report.pdf").write_bytes(b"fake pdf content here")
-    (tmp_dir / "photo.jpg").write_bytes(b"fake jpg data " * 100)
-    (tmp_dir / "notes.txt").write_text("some notes", encoding="utf-8")
+    (template / "report.pdf").write_bytes(b"fake pdf content here")
+    (template / "photo.jpg").write_bytes(b"fake jpg data " * 100)
+    (template / "notes.txt").write_text("some notes", encoding="utf-8")
 
     # Nested directory
-    sub = tmp_dir / "projects" / "my_app"
+    sub = template / "projects" / "my_app"
     sub.mkdir(parents=True)
     (sub / "main.py").write_text("print('hello')", encoding="utf-8")
 
     # System-like junk
-    (tmp_dir / "debug.log").write_bytes(b"log data")
-    (tmp_dir / "temp_file.tmp").write_bytes(b"temp")
-    (tmp_dir / "thumbs.db").write_bytes(b"thumbs")
+    (template / "debug.log").write_bytes(b"log data")
+    (template / "temp_file.tmp").write_bytes(b"temp")
+    (template / "thumbs.db").write_bytes(b"thumbs")
+
+    return template
 
-    return tmp_dir
+
+@pytest.fixture
+def populated_dir(tmp_dir: Path, _populated_template: Path) -> Path:
+    """Per-test copy of the session template (one copytree instead of
+    seven write cycles per test)."""
+    dest = tmp_dir / "populated"
+    shutil.copytree(_populated_template, dest)
+    return dest
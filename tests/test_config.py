@@ -58,6 +58,28 @@ class TestAppConfig:
         assert loaded.theme == "light"
         assert loaded.max_file_display == 200
 
+    def test_load_large_config(self, tmp_dir: Path, monkeypatch):
+        # Configs over 1 MiB take the mmap fast path when orjson is
+        # installed; a bad buffer type there used to fall through to the
+        # defaults handler and silently overwrite the user's config.
+        config_path = tmp_dir / "config.json"
+        monkeypatch.setattr("sessionclean.config.CONFIG_PATH", config_path)
+        monkeypatch.setattr("sessionclean.config.APP_DIR", tmp_dir)
+
+        original = AppConfig(
+            monitored_paths=[MonitoredPath(path=str(tmp_dir))],
+            # Pad past the 1 MiB mmap threshold
+            ignored_extensions=[f".pad{i:07d}" for i in range(100_000)],
+            theme="light",
+        )
+        original.save()
+        assert config_path.stat().st_size > 1 << 20
+
+        loaded = AppConfig.load()
+        assert loaded.theme == "light"
+        assert len(loaded.ignored_extensions) == 100_000
+        assert loaded.monitored_paths[0].path == str(tmp_dir)
+
     def test_load_corrupted_file(self, tmp_dir: Path, monkeypatch):
         config_path = tmp_dir / "config.json"
         app_dir = tmp_dir
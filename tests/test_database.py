@@ -9,9 +9,14 @@ from sessionclean.database import SnapshotDatabase
 
 
 @pytest.fixture
-def db(tmp_dir: Path) -> SnapshotDatabase:
-    """Provide a fresh database for each test."""
-    database = SnapshotDatabase(db_path=tmp_dir / "test.db")
+def db() -> SnapshotDatabase:
+    """Provide a fresh in-memory database for each test.
+
+    These tests are single-threaded, so :memory: is safe (each thread's
+    connection would otherwise see its own empty database) and skips the
+    per-test file creation, prefault, and mmap setup entirely.
+    """
+    database = SnapshotDatabase(db_path=Path(":memory:"))
     database.initialize()
     return database
 
@@ -33,6 +38,18 @@ class TestSnapshotDatabase:
         assert db.is_in_snapshot("C:\\Users\\test\\file1.txt") is True
         assert db.is_in_snapshot("C:\\Users\\test\\nonexistent.txt") is False
 
+    def test_is_in_snapshot_many(self, db: SnapshotDatabase):
+        records = [
+            ("C:\\Users\\test\\a.txt", 1000.0, 512),
+            ("C:\\Users\\test\\b.txt", 2000.0, 1024),
+        ]
+        db.store_snapshot_batch(records)
+
+        found = db.is_in_snapshot_many(
+            ["C:\\Users\\test\\a.txt", "C:\\Users\\test\\missing.txt"]
+        )
+        assert found == {"C:\\Users\\test\\a.txt"}
+
     def test_store_snapshot_ignores_duplicates(self, db: SnapshotDatabase):
         records = [("C:\\file.txt", 1000.0, 512)]
         db.store_snapshot_batch(records)
@@ -87,7 +104,11 @@ class TestSnapshotDatabase:
         assert db.get_snapshot_count() == 0
         assert db.get_new_files_count() == 0
 
-    def test_close(self, db: SnapshotDatabase):
-        db.close()
+    def test_close(self, tmp_dir: Path):
+        # Needs a file-backed DB: closing an in-memory connection destroys
+        # the database, so reconnection semantics can't be tested there.
+        database = SnapshotDatabase(db_path=tmp_dir / "close_test.db")
+        database.initialize()
+        database.close()
         # After closing, a new connection should be created on next use
-        assert db.get_snapshot_count() == 0
+        assert database.get_snapshot_count() == 0
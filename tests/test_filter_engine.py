@@ -1,5 +1,6 @@
 """Tests for the smart file filtering engine."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -19,13 +20,20 @@ def clean_engine() -> FilterEngine:
     """FilterEngine with path fragments cleared (for testing real temp files)."""
     eng = FilterEngine(AppConfig())
     eng._ignored_path_fragments = set()
+    eng._frag_automaton = None
+    eng._ignored_fragments_re = FilterEngine._compile_fragments(set())
     eng._ignored_directories = set()  # pytest tmp_path is inside AppData\Local\Temp
     return eng
 
 
-@pytest.fixture
-def populated_files(tmp_dir: Path) -> dict[str, Path]:
-    """Create test files and return a dict of name -> path."""
+@pytest.fixture(scope="session")
+def populated_files(tmp_path_factory) -> dict[str, Path]:
+    """Create test files once per session and return a dict of name -> path.
+
+    The filter tests only read these, so one shared tree avoids seven
+    write cycles per test.
+    """
+    tmp_dir = tmp_path_factory.mktemp("filters")
     files = {}
 
     # User-relevant files
@@ -111,6 +119,28 @@ class TestFilterEngine:
         pyc.write_bytes(b"bytecode")
         assert engine.should_include(str(pyc)) is False
 
+    def test_should_include_entry(self, clean_engine: FilterEngine, tmp_dir: Path):
+        (tmp_dir / "doc.pdf").write_bytes(b"pdf content")
+        (tmp_dir / "junk.tmp").write_bytes(b"temp data")
+        (tmp_dir / "empty.txt").write_bytes(b"")
+
+        verdicts = {
+            entry.name: clean_engine.should_include_entry(entry)
+            for entry in os.scandir(tmp_dir)
+        }
+        assert verdicts["doc.pdf"] is True
+        assert verdicts["junk.tmp"] is False
+        assert verdicts["empty.txt"] is False
+
+    def test_filter_batch(self, clean_engine: FilterEngine, populated_files):
+        paths = [
+            str(populated_files["pdf"]),
+            str(populated_files["log"]),
+            str(populated_files["empty"]),
+            str(populated_files["jpg"]),
+        ]
+        assert clean_engine.filter_batch(paths) == [True, False, False, True]
+
     def test_custom_ignored_extensions(self, tmp_dir: Path):
         config = AppConfig(ignored_extensions=[".xyz", ".custom"])
         engine = FilterEngine(config)
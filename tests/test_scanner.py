@@ -1,5 +1,6 @@
 """Tests for the startup snapshot scanner."""
 
+import os
 import time
 from pathlib import Path
 
@@ -20,7 +21,19 @@ def db(tmp_dir: Path) -> SnapshotDatabase:
 
 @pytest.fixture
 def engine() -> FilterEngine:
-    return FilterEngine(AppConfig())
+    """FilterEngine with tmp-path exclusions cleared.
+
+    The scanner filters files through the engine, and pytest tmp dirs
+    live under temp directories the default rules exclude outright
+    (same situation as test_filter_engine's clean_engine).
+    """
+    eng = FilterEngine(AppConfig())
+    eng._ignored_path_fragments = set()
+    eng._frag_automaton = None
+    eng._ignored_fragments_re = FilterEngine._compile_fragments(set())
+    eng._ignored_directories = frozenset({"node_modules", "__pycache__", ".git"})
+    eng._dir_cache = {}
+    return eng
 
 
 class TestScanner:
@@ -87,6 +100,34 @@ class TestScanner:
         assert db.is_in_snapshot(str(tmp_dir / "root_file.txt")) is True
         assert db.is_in_snapshot(str(sub / "nested_file.txt")) is False
 
+    def test_scan_coalesces_nested_roots(self, tmp_dir: Path, db, engine):
+        # A root nested under a recursive parent must not be walked twice
+        # (a dedicated root keeps the db fixture's file out of the walk)
+        root = tmp_dir / "root"
+        sub = root / "nested"
+        sub.mkdir(parents=True)
+        (sub / "file.txt").write_text("data", encoding="utf-8")
+
+        config = AppConfig(
+            monitored_paths=[
+                MonitoredPath(path=str(root), recursive=True),
+                MonitoredPath(path=str(sub), recursive=True),
+            ]
+        )
+        scanner = Scanner(config, db, engine)
+        count = scanner.take_snapshot()
+        assert count == 1
+
+    def test_coalesce_handles_drive_roots(self):
+        # normpath keeps the trailing separator on filesystem roots; a
+        # whole-drive root must still absorb its nested folders
+        paths = [
+            MonitoredPath(path=os.sep, recursive=True),
+            MonitoredPath(path=os.path.join(os.sep, "home"), recursive=True),
+        ]
+        coalesced = Scanner._coalesce_roots(paths)
+        assert [mp.path for mp in coalesced] == [os.sep]
+
     def test_scan_skips_ignored_directories(self, tmp_dir: Path, db, engine):
         # Create a file inside node_modules
         nm = tmp_dir / "node_modules" / "express"